@@ -100,6 +100,9 @@ class FileStub(object):
             raise FileStub.raise_on_write[self.filename]
         FileStub.file_contents[self.filename].extend(line.splitlines())
 
+    def read(self):
+        return "".join("{0}\n".format(line) for line in FileStub.file_contents[self.filename])
+
     def readline(self):
         file_contents_for_file = FileStub.file_contents[self.filename]
         next_line = file_contents_for_file[self.read_line_index]
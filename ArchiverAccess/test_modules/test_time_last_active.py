@@ -18,14 +18,23 @@ from datetime import datetime, timedelta
 from unittest import TestCase
 
 from hamcrest import *
+from mock import patch
 
 from ArchiverAccess.test_modules.stubs import FileStub
 from ArchiverAccess.time_last_active import TimeLastActive, TIME_LAST_ACTIVE_HEADER, TIME_LAST_ACTIVE_FILENAME, \
-    DEFAULT_DELTA
+    DEFAULT_DELTA, LAST_ACTIVE_FILE_BUFFER_SIZE
 
 
 class TestTimeLastActive(TestCase):
 
+    @patch("ArchiverAccess.time_last_active.open", create=True)
+    def test_GIVEN_default_file_open_method_WHEN_get_time_last_active_THEN_file_read_with_explicit_buffer(self, mock_open):
+        time_last_active = TimeLastActive(time_now_fn=lambda: datetime(2016, 1, 2, 3, 4, 5))
+
+        time_last_active.get()
+
+        mock_open.assert_called_once_with(TIME_LAST_ACTIVE_FILENAME, mode="r", buffering=LAST_ACTIVE_FILE_BUFFER_SIZE)
+
     def test_GIVEN_there_is_time_last_active_file_WHEN_get_time_last_active_THEN_date_time_in_file_returned(self):
         expected_time = datetime(2016, 1, 2, 3, 4, 5)
         time_last_active = self._setup_last_active_time(expected_time, 1, expected_time + timedelta(seconds=10))
@@ -89,6 +98,29 @@ class TestTimeLastActive(TestCase):
 
         assert_that(result, is_(expected_time))
 
+    def test_GIVEN_last_time_is_not_in_time_format_WHEN_get_time_last_active_THEN_current_time_minus_default_delta(self):
+        max_delta = 2
+        time_now = datetime(2016, 1, 6, 3, 4, 5)
+        expected_time = datetime(2016, 1, 5, 3, 4, 5)
+        last_active_time = "2016-01-02 03:04:05"
+        time_last_active = self._setup_last_active_time(last_active_time, max_delta, time_now)
+
+        result, _ = time_last_active.get()
+
+        assert_that(result, is_(expected_time))
+
+    def test_GIVEN_last_time_active_file_is_missing_lines_WHEN_get_time_last_active_THEN_current_time_minus_default_delta(self):
+        time_now = datetime(2016, 1, 6, 3, 4, 5)
+        expected_time = datetime(2016, 1, 5, 3, 4, 5)
+        FileStub.clear()
+        FileStub.add_file([TIME_LAST_ACTIVE_HEADER, datetime(2016, 1, 2, 3, 4, 5).isoformat()],
+                          TIME_LAST_ACTIVE_FILENAME)
+        time_last_active = TimeLastActive(file_open_method=FileStub, time_now_fn=lambda: time_now)
+
+        result, _ = time_last_active.get()
+
+        assert_that(result, is_(expected_time))
+
     def test_GIVEN_last_time_active_WHEN_set_time_last_active_THEN_file_contains_last_time_active(self):
         last_active_time = datetime(2016, 1, 5, 3, 4, 5)
         time_last_active = TimeLastActive(file_open_method=FileStub)
@@ -37,12 +37,45 @@ TIME_LAST_ACTIVE_FILENAME = os.path.join(DEFAULT_LOG_PATH, "LOG_last_active_time
 DEFAULT_DELTA = 1
 """If there is an error this is the default delta"""
 
+LAST_ACTIVE_FILE_BUFFER_SIZE = 65536
+"""Buffer size to open the last active file with, set explicitly rather than relying on the platform default"""
+
+
+def _parse_time(time_string):
+    """
+    Parse a time written in TIME_FORMAT. The fields are sliced out directly because strptime is slow.
+    Args:
+        time_string: the time string to parse
+
+    Returns: the time as a datetime
+    Raises ValueError: if the string is not in TIME_FORMAT
+
+    """
+    if len(time_string) != 19 or time_string[4] != "-" or time_string[7] != "-" or time_string[10] != "T" \
+            or time_string[13] != ":" or time_string[16] != ":":
+        raise ValueError("time data '{0}' does not match format '{1}'".format(time_string, TIME_FORMAT))
+    return datetime(int(time_string[0:4]), int(time_string[5:7]), int(time_string[8:10]),
+                    int(time_string[11:13]), int(time_string[14:16]), int(time_string[17:19]))
+
+
+def open_last_active_file(filepath, mode):
+    """
+    Open the last active file with an explicit buffer size
+    Args:
+        filepath: path of the file to open
+        mode: mode to open the file in
+
+    Returns: the opened file
+
+    """
+    return open(filepath, mode=mode, buffering=LAST_ACTIVE_FILE_BUFFER_SIZE)
+
 
 class TimeLastActive(object):
     """
     Allow Getting and Settting of the time last active log was written. This is stored in a file.
     """
-    def __init__(self, file_open_method=open, time_now_fn=utc_time_now):
+    def __init__(self, file_open_method=open_last_active_file, time_now_fn=utc_time_now):
         """
         Constructor
         Args:
@@ -75,11 +108,11 @@ class TimeLastActive(object):
         sample_id = 0
         try:
             with self._file_open_method(TIME_LAST_ACTIVE_FILENAME, mode="r") as time_last_active_file:
-                time_last_active_file.readline()
-                last_active_time = datetime.strptime(time_last_active_file.readline().strip(), TIME_FORMAT)
-                max_delta = int(time_last_active_file.readline().strip())
-                sample_id = int(time_last_active_file.readline().strip())
-        except (ValueError, TypeError, IOError) as ex:
+                lines = time_last_active_file.read().splitlines()
+            last_active_time = _parse_time(lines[1].strip())
+            max_delta = int(lines[2].strip())
+            sample_id = int(lines[3].strip())
+        except (ValueError, TypeError, IOError, IndexError) as ex:
             print_and_log("Failed to read last active file error '{0}'".format(ex),
                           severity=SEVERITY.MINOR, src="ArchiverAccess")
             return time_now - timedelta(days=DEFAULT_DELTA), sample_id
@@ -103,9 +136,7 @@ class TimeLastActive(object):
         """
         try:
             with self._file_open_method(TIME_LAST_ACTIVE_FILENAME, mode="w") as time_last_active_file:
-                time_last_active_file.write("{0}\n".format(TIME_LAST_ACTIVE_HEADER))
-                time_last_active_file.write("{0}\n".format(last_active_time.strftime(TIME_FORMAT)))
-                time_last_active_file.write("{0}\n".format(delta))
-                time_last_active_file.write("{0}\n".format(last_sample_id))
+                time_last_active_file.write("{0}\n{1}\n{2}\n{3}\n".format(
+                    TIME_LAST_ACTIVE_HEADER, last_active_time.strftime(TIME_FORMAT), delta, last_sample_id))
         except (ValueError, TypeError, IOError) as err:
             print_and_log("Error writing last activity file: '{0}'".format(err))
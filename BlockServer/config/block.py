@@ -34,6 +34,10 @@ class Block:
             log_rate (float): Time between archive samples (in seconds)
             log_deadband (float): Deadband for the block to be archived
     """
+    __slots__ = ("name", "pv", "local", "visible", "component", "rc_lowlimit", "rc_highlimit", "rc_enabled",
+                 "rc_suspend_on_invalid", "log_periodic", "log_rate", "log_deadband", "set_block", "set_block_val",
+                 "group")
+
     def __init__(self, name: str, pv: str, local: bool = True, visible: bool = True, component: str = None, runcontrol:
                  bool = False, lowlimit: float = None, highlimit: float = None, suspend_on_invalid: bool = False,
                  log_periodic: bool = False, log_rate: float = 5, log_deadband: float = 0, set_block: bool = False,
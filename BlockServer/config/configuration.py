@@ -15,7 +15,6 @@
 # http://opensource.org/licenses/eclipse-1.0.php
 
 """ Contains all the code for defining a configuration or component"""
-from collections import OrderedDict
 from typing import Dict
 
 from BlockServer.config.group import Group
@@ -31,12 +30,12 @@ class Configuration:
     """ The Configuration class.
 
     Attributes:
-        blocks (OrderedDict): The blocks for the configuration
+        blocks (dict): The blocks for the configuration
         macros (dict): The EPICS/BlockServer related macros
-        groups (OrderedDict): The groups for the configuration
-        iocs (OrderedDict): The IOCs for the configuration
+        groups (dict): The groups for the configuration
+        iocs (dict): The IOCs for the configuration
         meta (MetaData): The meta-data for the configuration
-        components (OrderedDict): The components which are part of the configuration
+        components (dict): The components which are part of the configuration
         is_component (bool): Whether it is actually a component
     """
     def __init__(self, macros: Dict):
@@ -46,12 +45,12 @@ class Configuration:
             macros: The dictionary containing the macros
         """
         # All dictionary keys are lowercase except iocs which is uppercase
-        self.blocks = OrderedDict()
+        self.blocks = {}
         self.macros = macros
-        self.groups = OrderedDict()
-        self.iocs = OrderedDict()
+        self.groups = {}
+        self.iocs = {}
         self.meta = MetaData("")
-        self.components = OrderedDict()
+        self.components = {}
         self.is_component = False
 
     def add_block(self, name: str, pv: str, group: str = GRP_NONE, local: bool = True, **kwargs):
@@ -24,6 +24,8 @@ class Group:
             blocks (dict): The blocks that are in the group
             component (string): The component the group belongs to
     """
+    __slots__ = ("name", "blocks", "component")
+
     def __init__(self, name: str, component: str = None):
         """ Constructor.
 
@@ -14,7 +14,6 @@
 # https://www.eclipse.org/org/documents/epl-v10.php or
 # http://opensource.org/licenses/eclipse-1.0.php
 
-import copy
 from typing import Dict, List, Union, Any
 
 
@@ -31,6 +30,8 @@ class IOC:
         pvsets (dict): The IOC's PV sets
         simlevel (string): The level of simulation
     """
+    __slots__ = ("name", "autostart", "restart", "component", "remotePvPrefix", "simlevel", "macros", "pvs", "pvsets")
+
     def __init__(self, name: str, autostart: bool = True, restart: bool = True, component: str = None, macros: Dict =
                  None, pvs: Dict = None, pvsets: Dict = None, simlevel: str = None, remotePvPrefix: str = None):
         """ Constructor.
@@ -85,13 +86,8 @@ class IOC:
         Returns:
             The newly created list
         """
-        out_list = []
-        for k, v in in_dict.items():
-            # Take a copy as we do not want to modify the original
-            c = copy.deepcopy(v)
-            c['name'] = k
-            out_list.append(c)
-        return out_list
+        # Take a copy as we do not want to modify the original, a shallow copy is enough as the entries hold strings
+        return [dict(v, name=k) for k, v in in_dict.items()]
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name}, component={self.component})"
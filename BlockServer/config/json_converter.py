@@ -14,10 +14,12 @@
 # https://www.eclipse.org/org/documents/epl-v10.php or
 # http://opensource.org/licenses/eclipse-1.0.php
 
-import json
 from collections import OrderedDict
 from typing import List, Any, Dict
 from BlockServer.core.constants import GRP_NONE
+from server_common.utilities import convert_to_json
+
+KEY_NONE = GRP_NONE.lower()
 
 
 class ConfigurationJsonConverter:
@@ -31,13 +33,13 @@ class ConfigurationJsonConverter:
     def _groups_to_list(groups: OrderedDict) -> List[Dict[str, Any]]:
         grps = []
         if groups is not None:
-            for group in groups.values():
-                if group.name.lower() != GRP_NONE.lower():
-                    grps.append({"name": group.name, "component": group.component, "blocks": group.blocks})
+            grps = [{"name": group.name, "component": group.component, "blocks": group.blocks}
+                    for group in groups.values() if group.name.lower() != KEY_NONE]
 
             # Add NONE group at end
-            if GRP_NONE.lower() in groups.keys():
-                grps.append({"name": GRP_NONE, "component": None, "blocks": groups[GRP_NONE.lower()].blocks})
+            none_group = groups.get(KEY_NONE)
+            if none_group is not None:
+                grps.append({"name": GRP_NONE, "component": None, "blocks": none_group.blocks})
         return grps
 
     @staticmethod
@@ -51,4 +53,4 @@ class ConfigurationJsonConverter:
             string : The groups as a JSON list
         """
         grps = ConfigurationJsonConverter._groups_to_list(groups)
-        return json.dumps(grps)
+        return convert_to_json(grps)
@@ -26,6 +26,9 @@ class MetaData:
         synoptic (string): The default synoptic view for this configuration
         history (list): The save history of the configuration
     """
+    __slots__ = ("name", "pv", "description", "synoptic", "history", "isProtected", "isDynamic",
+                 "configuresBlockGWAndArchiver")
+
     def __init__(self, config_name: str, pv_name: str = "", description: str = "", synoptic: str = ""):
         """ Constructor.
 
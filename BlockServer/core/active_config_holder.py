@@ -40,12 +40,7 @@ def _blocks_changed(block1, block2):
     if block1.name != block2.name:
         return True
 
-    # Check for any changed blocks (symmetric difference operation of sets)
-    block_diff = set(block1.to_dict().items()) ^ set(block2.to_dict().items())
-    if len(block_diff) > 0:
-        return True
-
-    return False
+    return block1.to_dict() != block2.to_dict()
 
 
 def _blocks_changed_in_config(old_config, new_config, block_comparator=_blocks_changed):
@@ -67,12 +62,8 @@ def _blocks_changed_in_config(old_config, new_config, block_comparator=_blocks_c
                 block_comparator(old_config.blocks[block_name], new_config.blocks[block_name]):
             return True
 
-    for block_name in old_config.blocks.keys():
-        if block_name not in new_config.blocks.keys() \
-                or block_comparator(old_config.blocks[block_name], new_config.blocks[block_name]):
-            return True
-
-    return False
+    # Blocks in both have been compared above so only need to check for removed blocks
+    return any(block_name not in new_config.blocks for block_name in old_config.blocks.keys())
 
 
 def _compare_ioc_properties(old: Dict[str, IOC], new: Dict[str, IOC]):
@@ -245,7 +236,7 @@ class ActiveConfigHolder(ConfigHolder):
         # to need stopping or restarting on config change.
         for ioc_name in get_iocs(CONTROL_SYSTEM_PREFIX):
             # IOCS which shouldn't be stopped.
-            if any(ioc_name.startswith(x) for x in IOCS_NOT_TO_STOP):
+            if ioc_name.startswith(IOCS_NOT_TO_STOP):
                 continue
 
             # IOCS which have already been considered as they're part of the cached config or components
@@ -107,15 +107,16 @@ class ConfigHolder:
         Returns:
             The names of all the blocks
         """
-        names = []
-        for block in self._config.blocks.values():
-            names.append(block.name)
+        names = [block.name for block in self._config.blocks.values()]
+        # Set of the names for fast duplicate checks, the list keeps the order
+        seen_names = set(names)
 
         for component in self._components.values():
             for block in component.blocks.values():
                 # Ignore duplicates
-                if block.name not in names:
+                if block.name not in seen_names:
                     names.append(block.name)
+                    seen_names.add(block.name)
         return names
 
     def get_block_details(self):
@@ -137,12 +138,12 @@ class ConfigHolder:
         Returns:
             A dictionary of group objects
         """
-        blocks = self.get_blocknames()
-        used_blocks = []
+        blocks = set(self.get_blocknames())
+        used_blocks = set()
         groups = copy.deepcopy(self._config.groups)
 
         for group in groups.values():
-            used_blocks.extend(group.blocks)
+            used_blocks.update(group.blocks)
 
         for component in self._components.values():
             for group_name, grp in component.groups.items():
@@ -151,14 +152,14 @@ class ConfigHolder:
                     blks = [x for x in grp.blocks if x not in used_blocks and x in blocks]
                     groups[group_name] = grp
                     groups[group_name].blocks = blks
-                    used_blocks.extend(blks)
+                    used_blocks.update(blks)
                 else:
                     # If group exists then append with component group
                     # But don't add any duplicate blocks or blocks that don't exist
                     for bn in grp.blocks:
-                        if bn not in groups[group_name].blocks and bn not in used_blocks and bn in blocks:
+                        if bn not in used_blocks and bn in blocks and bn not in groups[group_name].blocks:
                             groups[group_name].blocks.append(bn)
-                            used_blocks.append(bn)
+                            used_blocks.add(bn)
 
         # If any groups are empty now we've filled in from the components, get rid of them
         # This is an ordered dict so we need to copy it before iterating - throws a runtime error if it has mutated.
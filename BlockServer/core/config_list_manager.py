@@ -15,7 +15,6 @@
 # http://opensource.org/licenses/eclipse-1.0.php
 
 import os
-import json
 
 import traceback
 from functools import wraps
@@ -29,7 +28,7 @@ from BlockServer.core.config_list_manager_exceptions import InvalidDeleteExcepti
 from server_common.channel_access import verify_manager_mode, ChannelAccess
 
 from server_common.utilities import print_and_log, compress_and_hex, create_pv_name, convert_to_json, \
-    lowercase_and_make_unique
+    lowercase_and_make_unique, compress_and_hex_json
 from server_common.common_exceptions import MaxAttemptsExceededException
 from server_common.pv_names import BlockserverPVNames
 
@@ -88,29 +87,40 @@ class ConfigListManager:
         self.active_components = []
         self.all_components = {}
         self._lock = RLock()
+        # Incremented whenever a config or component is added, changed or deleted so that update_monitors can skip
+        # recompressing the lists if they are unchanged since they were last published
+        self._lists_version = 0
+        self._published_lists_version = None
+        # The uncompressed values last set on the per config and component PVs
+        self._pv_values = {}
         self.channel_access = channel_access
         self.file_manager = file_manager
 
-        self._conf_path = FILEPATH_MANAGER.config_dir
-        self._comp_path = FILEPATH_MANAGER.component_dir
+        self._conf_path = os.path.abspath(FILEPATH_MANAGER.config_dir)
+        self._comp_path = os.path.abspath(FILEPATH_MANAGER.component_dir)
         self._import_configs()
 
     def _update_pv_value(self, fullname, data):
         # First check PV exists if not create it
         if not self._bs.does_pv_exist(fullname):
             self._bs.add_string_pv_to_db(fullname, count=16000)
+        elif self._pv_values.get(fullname) == data:
+            # Nothing has changed so there is no need to compress the data and update the monitors again
+            return
 
-        self._bs.setParam(fullname, data)
+        self._bs.setParam(fullname, compress_and_hex(data))
         self._bs.updatePVs()
+        self._pv_values[fullname] = data
 
     def _delete_pv(self, fullname):
         self._bs.delete_pv_from_db(fullname)
+        self._pv_values.pop(fullname, None)
 
     def _get_config_names(self):
-        return self._get_file_list(os.path.abspath(self._conf_path))
+        return self._get_file_list(self._conf_path)
 
     def _get_component_names(self):
-        comp_list = self._get_file_list(os.path.abspath(self._comp_path))
+        comp_list = self._get_file_list(self._comp_path)
         return [component_name for component_name in comp_list]
 
     def _get_file_list(self, path):
@@ -189,17 +199,17 @@ class ConfigListManager:
         if name in self._component_metas.keys():
             # Check just in case component failed to load
             pv_name = BlockserverPVNames.get_dependencies_pv(self._component_metas[name].pv)
-            self._update_pv_value(pv_name, compress_and_hex(json.dumps(configs)))
+            self._update_pv_value(pv_name, convert_to_json(configs))
 
     def _update_config_pv(self, name, data):
         # Updates pvs with new data
         pv_name = BlockserverPVNames.get_config_details_pv(self._config_metas[name].pv)
-        self._update_pv_value(pv_name, compress_and_hex(json.dumps(data)))
+        self._update_pv_value(pv_name, convert_to_json(data))
 
     def _update_component_pv(self, name, data):
         # Updates pvs with new data
         pv_name = BlockserverPVNames.get_component_details_pv(self._component_metas[name].pv)
-        self._update_pv_value(pv_name, compress_and_hex(json.dumps(data)))
+        self._update_pv_value(pv_name, convert_to_json(data))
 
     @needs_lock
     def update(self, config, is_component=False):
@@ -209,11 +219,9 @@ class ConfigListManager:
             config (ConfigHolder): The configuration holder
             is_component (bool): Whether it is a component or not
         """
-        # Update dynamic PVs
+        # Update dynamic PVs, the static PVs are updated when this has finished
         self.update_a_config_in_list(config, is_component)
 
-        # Update static PVs (some of these aren't completely necessary)
-        self.update_monitors()
         if is_component:
             if config.get_config_name().lower() in [x.lower() for x in self.active_components]:
                 print_and_log("Active component edited in filesystem, reloading to get changes",
@@ -234,6 +242,7 @@ class ConfigListManager:
         """
         name = config.get_config_name()
         name_lower = name.lower()
+        self._lists_version += 1
 
         # Get pv name (create if doesn't exist)
         pv_name = self._get_pv_name(name_lower, is_component)
@@ -317,6 +326,7 @@ class ConfigListManager:
 
         self._delete_pv(BlockserverPVNames.get_config_details_pv(self._config_metas[config.lower()].pv))
         del self._config_metas[config.lower()]
+        self._lists_version += 1
         self._remove_config_from_dependencies(config)
 
     @deletion_context
@@ -375,6 +385,7 @@ class ConfigListManager:
         self._delete_pv(BlockserverPVNames.get_dependencies_pv(self._component_metas[component].pv))
         del self._component_metas[component]
         del self.all_components[component]
+        self._lists_version += 1
 
     @needs_lock
     def get_dependencies(self, comp_name):
@@ -390,14 +401,21 @@ class ConfigListManager:
         return [] if dependencies is None else dependencies
 
     def update_monitors(self):
+        """Updates the monitors for the lists of configs and components, if they have changed since last updated.
+        """
+        # Read the version before building the lists so a change made while they are built is published next time
+        version = self._lists_version
+        if self._published_lists_version == version:
+            return
         with self._bs.monitor_lock:
             print_and_log("Updating config list monitors")
             # Set the available configs
-            self._bs.setParam(BlockserverPVNames.CONFIGS, compress_and_hex(convert_to_json(self.get_configs())))
+            self._bs.setParam(BlockserverPVNames.CONFIGS, compress_and_hex_json(self.get_configs()))
             # Set the available comps
-            self._bs.setParam(BlockserverPVNames.COMPS, compress_and_hex(convert_to_json(self.get_components())))
+            self._bs.setParam(BlockserverPVNames.COMPS, compress_and_hex_json(self.get_components()))
             # Set the available component details
             self._bs.setParam(BlockserverPVNames.ALL_COMPONENT_DETAILS,
-                              compress_and_hex(convert_to_json(list(self.all_components.values()))))
+                              compress_and_hex_json(list(self.all_components.values())))
             # Update them
             self._bs.updatePVs()
+            self._published_lists_version = version
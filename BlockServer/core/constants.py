@@ -64,7 +64,7 @@ TAG_RC_ENABLE = ":RC:ENABLE"
 TAG_RC_SUSPEND_ON_INVALID = ":RC:SOI"
 TAG_RC_OUT_LIST = "CS:RC:OUT:LIST"
 
-SIMLEVELS = ['recsim', 'devsim']
+SIMLEVELS = frozenset(('recsim', 'devsim'))
 
 # Name of default component that is loaded with every configuration.
 # Contains essential IOCs (and blocks/groups?) e.g. DAE, INSTETC
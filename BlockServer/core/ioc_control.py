@@ -14,6 +14,7 @@
 # https://www.eclipse.org/org/documents/epl-v10.php or
 # http://opensource.org/licenses/eclipse-1.0.php
 
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep, time
 from typing import List
 
@@ -22,6 +23,9 @@ from BlockServer.alarm.load_alarm_config import AlarmConfigLoader
 from server_common.utilities import print_and_log
 from server_common.constants import IOCS_NOT_TO_STOP
 
+MAX_CONCURRENT_IOC_STOPS = 10
+"""Maximum number of IOCs to wait to stop at once when stopping several IOCs"""
+
 
 class IocControl:
     """A class for starting, stopping and restarting IOCs"""
@@ -32,6 +36,8 @@ class IocControl:
             prefix (string): The PV prefix for the instrument
         """
         self._proc = ProcServWrapper(prefix)
+        # Used only for stopping IOCs, so that it is not shut down by ChannelAccess.wait_for_tasks
+        self._stop_pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_IOC_STOPS, thread_name_prefix="IocControl_Stop")
 
     def start_ioc(self, ioc: str, restart_alarm_server: bool = True):
         """Start an IOC.
@@ -68,19 +74,20 @@ class IocControl:
         except Exception as err:
             print_and_log(f"Could not restart IOC {ioc}: {err}", "MAJOR")
 
-    def stop_ioc(self, ioc: str, force: bool = False):
+    def stop_ioc(self, ioc: str, force: bool = False, restart_alarm_server: bool = True):
         """Stop an IOC.
 
         Args:
             ioc (string): The name of the IOC
             force (bool): Force it to stop even if it is an IOC not to stop
+            restart_alarm_server (bool): whether to also restart the alarm server
         """
         # Check it is okay to stop it
         if not force and ioc.startswith(IOCS_NOT_TO_STOP):
             return
         try:
             self._proc.stop_ioc(ioc)
-            if ioc != "ALARM":
+            if ioc != "ALARM" and restart_alarm_server:
                 AlarmConfigLoader.restart_alarm_server(self)
         except Exception as err:
             print_and_log(f"Could not stop IOC {ioc}: {err}", "MAJOR")
@@ -137,11 +144,20 @@ class IocControl:
     def stop_iocs(self, iocs: List[str]):
         """ Stop a number of IOCs.
 
+        Stopping waits for the put to complete, so the IOCs are stopped together rather than waiting for each one in
+        turn. The alarm server is then restarted once for all of them.
+
         Args:
             iocs (list): The IOCs to stop
         """
-        for ioc in iocs:
-            self.stop_ioc(ioc)
+        stops = [self._stop_pool.submit(self.stop_ioc, ioc, restart_alarm_server=False) for ioc in iocs]
+        for stop in stops:
+            stop.result()
+        if any(ioc != "ALARM" and not ioc.startswith(IOCS_NOT_TO_STOP) for ioc in iocs):
+            try:
+                AlarmConfigLoader.restart_alarm_server(self)
+            except Exception as err:
+                print_and_log(f"Could not restart alarm server after stopping IOCs: {err}", "MAJOR")
 
     def ioc_exists(self, ioc: str) -> bool:
         """Checks an IOC exists.
@@ -16,14 +16,13 @@
 import re
 import os
 import shutil
-from collections import OrderedDict
 from xml.etree import ElementTree
 from BlockServer.config.group import Group
 from BlockServer.config.xml_converter import ConfigurationXmlConverter
 from BlockServer.config.configuration import Configuration, MetaData
 from BlockServer.core.constants import FILENAME_BLOCKS, FILENAME_GROUPS, FILENAME_IOCS, FILENAME_COMPONENTS, \
     FILENAME_META, FILENAME_BANNER
-from BlockServer.core.constants import GRP_NONE, DEFAULT_COMPONENT, EXAMPLE_DEFAULT
+from BlockServer.core.constants import GRP_NONE, DEFAULT_COMPONENT, EXAMPLE_DEFAULT, TAG_SIMLEVEL
 from BlockServer.core.file_path_manager import FILEPATH_MANAGER
 from BlockServer.fileIO.schema_checker import ConfigurationSchemaChecker, ConfigurationIncompleteException
 from server_common.utilities import print_and_log, retry
@@ -63,11 +62,15 @@ class ConfigurationFileManager:
         if not os.path.isdir(path):
             raise IOError(f"Configuration could not be found: {name}")
 
-        # Create empty containers
-        blocks = OrderedDict()
-        groups = OrderedDict()
-        components = OrderedDict()
-        iocs = OrderedDict()
+        # List the directory once rather than checking for each file, normcase makes this case insensitive on Windows
+        # in the same way as checking each file would be
+        files_present = {os.path.normcase(entry.name) for entry in os.scandir(path) if entry.is_file()}
+
+        # Create empty containers, dicts keep their insertion order so the items are kept in file order
+        blocks = {}
+        groups = {}
+        components = {}
+        iocs = {}
 
         # Make sure NONE group exists
         groups[GRP_NONE.lower()] = Group(GRP_NONE)
@@ -76,11 +79,12 @@ class ConfigurationFileManager:
 
         # Open the block file first
         blocks_path = os.path.join(path, FILENAME_BLOCKS)
-        if os.path.isfile(blocks_path):
-            root = self._read_element_tree(blocks_path)
+        if os.path.normcase(FILENAME_BLOCKS) in files_present:
+            xml_data = self._read_xml_file(blocks_path)
+            root = ElementTree.fromstring(xml_data)
 
             # Check against the schema - raises if incorrect
-            self._check_against_schema(ElementTree.tostring(root, encoding='utf8'), FILENAME_BLOCKS)
+            self._check_against_schema(xml_data, FILENAME_BLOCKS)
 
             ConfigurationXmlConverter.blocks_from_xml(root, blocks, groups)
         else:
@@ -88,11 +92,12 @@ class ConfigurationFileManager:
 
         # Import the groups
         groups_path = os.path.join(path, FILENAME_GROUPS)
-        if os.path.isfile(groups_path):
-            root = self._read_element_tree(groups_path)
+        if os.path.normcase(FILENAME_GROUPS) in files_present:
+            xml_data = self._read_xml_file(groups_path)
+            root = ElementTree.fromstring(xml_data)
 
             # Check against the schema - raises if incorrect
-            self._check_against_schema(ElementTree.tostring(root, encoding='utf8'), FILENAME_GROUPS)
+            self._check_against_schema(xml_data, FILENAME_GROUPS)
 
             ConfigurationXmlConverter.groups_from_xml(root, groups, blocks)
         else:
@@ -100,14 +105,18 @@ class ConfigurationFileManager:
 
         # Import the IOCs
         iocs_path = os.path.join(path, FILENAME_IOCS)
-        if os.path.isfile(iocs_path):
-            root = self._read_element_tree(iocs_path)
+        if os.path.normcase(FILENAME_IOCS) in files_present:
+            xml_data = self._read_xml_file(iocs_path)
+            root = ElementTree.fromstring(xml_data)
 
             # There was a historic bug where the simlevel was saved as 'None' rather than "none".
-            # Correct that here
-            correct_xml = ElementTree.tostring(root, encoding='utf8')
-
-            correct_xml = correct_xml.replace(b'simlevel="None"', b'simlevel="none"')
+            # Correct that here, only re-serialising the file for the schema check if anything needed correcting
+            corrected = False
+            for element in root.iter():
+                if element.get(TAG_SIMLEVEL) == "None":
+                    element.set(TAG_SIMLEVEL, "none")
+                    corrected = True
+            correct_xml = ElementTree.tostring(root, encoding='utf8') if corrected else xml_data
 
             # Check against the schema - raises if incorrect
             self._check_against_schema(correct_xml, FILENAME_IOCS)
@@ -118,11 +127,12 @@ class ConfigurationFileManager:
 
         # Import the components
         component_path = os.path.join(path, FILENAME_COMPONENTS)
-        if os.path.isfile(component_path):
-            root = self._read_element_tree(component_path)
+        if os.path.normcase(FILENAME_COMPONENTS) in files_present:
+            xml_data = self._read_xml_file(component_path)
+            root = ElementTree.fromstring(xml_data)
 
             # Check against the schema - raises if incorrect
-            self._check_against_schema(ElementTree.tostring(root, encoding='utf8'), FILENAME_COMPONENTS)
+            self._check_against_schema(xml_data, FILENAME_COMPONENTS)
 
             ConfigurationXmlConverter.components_from_xml(root, components)
         elif not is_component:
@@ -132,11 +142,12 @@ class ConfigurationFileManager:
         # Import the metadata
         meta = MetaData(name)
         meta_path = os.path.join(path, FILENAME_META)
-        if os.path.isfile(meta_path):
-            root = self._read_element_tree(meta_path)
+        if os.path.normcase(FILENAME_META) in files_present:
+            xml_data = self._read_xml_file(meta_path)
+            root = ElementTree.fromstring(xml_data)
 
             # Check against the schema - raises if incorrect
-            self._check_against_schema(ElementTree.tostring(root, encoding='utf8'), FILENAME_META)
+            self._check_against_schema(xml_data, FILENAME_META)
 
             ConfigurationXmlConverter.meta_from_xml(root, meta)
         else:
@@ -236,7 +247,7 @@ class ConfigurationFileManager:
                         os.path.join(dest_path, DEFAULT_COMPONENT))
 
     @staticmethod
-    def _read_element_tree(file_path):
+    def _read_xml_file(file_path):
         try:
             return ConfigurationFileManager._attempt_read(file_path)
         except MaxAttemptsExceededException:
@@ -253,12 +264,19 @@ class ConfigurationFileManager:
     @staticmethod
     @retry(RETRY_MAX_ATTEMPTS, RETRY_INTERVAL, (OSError, IOError))
     def _attempt_read(file_path):
-        """ Read and return the element tree from a given xml file.
+        """ Read and return the raw data from a given xml file.
+
+        The data is read once and then used both to check against the schema and to build the element tree, so the
+        tree does not need serialising again for the schema check.
 
         Args:
             file_path (string): The location of the file being read
+
+        Returns:
+            bytes: The contents of the file
         """
-        return ElementTree.parse(file_path).getroot()
+        with open(file_path, 'rb') as f:
+            return f.read()
 
     @staticmethod
     @retry(RETRY_MAX_ATTEMPTS, RETRY_INTERVAL, (OSError, IOError))
@@ -306,15 +324,13 @@ class ConfigurationFileManager:
             empty dictionary if it doesn't exist or fails to parse.
         """
         if os.path.exists(FILEPATH_MANAGER.get_banner_path()):
-            root = ConfigurationFileManager._read_element_tree(FILEPATH_MANAGER.get_banner_path())
+            xml_data = ConfigurationFileManager._read_xml_file(FILEPATH_MANAGER.get_banner_path())
+            root = ElementTree.fromstring(xml_data)
 
             # Check against the schema - raises if incorrect
-            ConfigurationFileManager._check_against_schema(ElementTree.tostring(root, encoding='utf8'),
-                                                           FILENAME_BANNER)
+            ConfigurationFileManager._check_against_schema(xml_data, FILENAME_BANNER)
             try:
-                banner = ConfigurationXmlConverter.banner_config_from_xml(
-                    ConfigurationFileManager._attempt_read(FILEPATH_MANAGER.get_banner_path())
-                )
+                banner = ConfigurationXmlConverter.banner_config_from_xml(root)
             except Exception as ex:
                 # XML failed to parse. Log the error and return an empty list
                 print_and_log(f"Failed to parse banner xml file. Error was {ex.__class__.__name__} {ex}")
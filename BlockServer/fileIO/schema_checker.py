@@ -15,6 +15,7 @@
 # http://opensource.org/licenses/eclipse-1.0.php
 
 import os
+from functools import lru_cache
 from lxml import etree
 
 
@@ -99,8 +100,10 @@ class ConfigurationSchemaChecker:
         schema.assertValid(doc)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _get_schema(schema_folder, schema_file):
-        """ This method generates an xml schemaq object for later use in validation.
+        """ This method generates an xml schemaq object for later use in validation. The schema files do not change
+        while the server is running, so the schema object is only generated once for each file.
 
         Args:
             schema_folder (string): The directory for schema files
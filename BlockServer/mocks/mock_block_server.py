@@ -14,7 +14,7 @@
 # https://www.eclipse.org/org/documents/epl-v10.php or
 # http://opensource.org/licenses/eclipse-1.0.php
 
-from threading import RLock
+from threading import Lock
 
 
 class MockBlockServer:
@@ -22,7 +22,7 @@ class MockBlockServer:
         self._comps = []
         self._confs = []
         self.pvs = {}
-        self.monitor_lock = RLock()
+        self.monitor_lock = Lock()
 
     def set_config_list(self, cl):
         self._config_list = cl
@@ -41,6 +41,9 @@ class MockVersionControl:
     def update(self, update_path=""):
         pass
 
+    def request_push(self):
+        pass
+
 
 class FailOnAddMockVersionControl(MockVersionControl):
     def add(self, file_path):
@@ -0,0 +1,68 @@
+# This file is part of the ISIS IBEX application.
+# Copyright (C) 2012-2016 Science & Technology Facilities Council.
+# All rights reserved.
+#
+# This program is distributed in the hope that it will be useful.
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License v1.0 which accompanies this distribution.
+# EXCEPT AS EXPRESSLY SET FORTH IN THE ECLIPSE PUBLIC LICENSE V1.0, THE PROGRAM
+# AND ACCOMPANYING MATERIALS ARE PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND.  See the Eclipse Public License v1.0 for more details.
+#
+# You should have received a copy of the Eclipse Public License v1.0
+# along with this program; if not, you can obtain a copy from
+# https://www.eclipse.org/org/documents/epl-v10.php or
+# http://opensource.org/licenses/eclipse-1.0.php
+
+import unittest
+from threading import Thread, RLock, local
+
+from mock import patch
+from pcaspy import Driver
+
+from block_server import BlockServer
+
+
+class TestBlockServerMonitorBatching(unittest.TestCase):
+    def setUp(self):
+        # Don't run the constructor as that connects to version control and starts the server threads
+        self.block_server = BlockServer.__new__(BlockServer)
+        self.block_server.monitor_lock = RLock()
+        self.block_server._monitor_batch = local()
+
+    def _run_with_timeout(self, target):
+        thread = Thread(target=target)
+        thread.daemon = True
+        thread.start()
+        thread.join(5)
+        self.assertFalse(thread.is_alive(), "Timed out, probably deadlocked")
+
+    @patch.object(Driver, "updatePVs")
+    def test_GIVEN_nested_batches_WHEN_monitors_updated_THEN_update_posted_once_when_outer_batch_exits(
+            self, update_pvs):
+        with self.block_server.batch_monitor_updates():
+            with self.block_server.batch_monitor_updates():
+                self.block_server.updatePVs()
+            self.block_server.updatePVs()
+            update_pvs.assert_not_called()
+
+        update_pvs.assert_called_once_with()
+
+    @patch.object(Driver, "updatePVs")
+    def test_GIVEN_monitor_lock_held_WHEN_nested_batches_exit_THEN_update_posted_without_deadlock(self, update_pvs):
+        def update_in_batches_holding_monitor_lock():
+            with self.block_server.monitor_lock:
+                with self.block_server.batch_monitor_updates():
+                    with self.block_server.batch_monitor_updates():
+                        self.block_server.updatePVs()
+
+        self._run_with_timeout(update_in_batches_holding_monitor_lock)
+
+        update_pvs.assert_called_once_with()
+
+    @patch.object(Driver, "updatePVs")
+    def test_GIVEN_no_monitor_updates_WHEN_batch_exits_THEN_nothing_posted(self, update_pvs):
+        with self.block_server.batch_monitor_updates():
+            pass
+
+        update_pvs.assert_not_called()
@@ -21,7 +21,7 @@ from BlockServer.core.config_list_manager import ConfigListManager, InvalidDelet
 from BlockServer.core.active_config_holder import ActiveConfigHolder
 from BlockServer.mocks.mock_channel_access import MockChannelAccess
 from server_common.channel_access import ManagerModeRequiredException
-from server_common.pv_names import prepend_blockserver
+from server_common.pv_names import prepend_blockserver, BlockserverPVNames
 from BlockServer.mocks.mock_block_server import MockBlockServer
 from BlockServer.core.inactive_config_holder import InactiveConfigHolder
 from BlockServer.core.constants import DEFAULT_COMPONENT
@@ -618,3 +618,48 @@ class TestInactiveConfigsSequence(unittest.TestCase):
 
         with self.assertRaises(ManagerModeRequiredException):
             self.clm.delete_components(["TEST_COMPONENT1"])
+
+    def test_GIVEN_config_list_unchanged_WHEN_monitors_updated_THEN_config_list_pv_not_set_again(self):
+        self._create_configs(["TEST_CONFIG1"], self.clm)
+        del self.bs.pvs[BlockserverPVNames.CONFIGS]
+
+        self.clm.update_monitors()
+
+        self.assertFalse(BlockserverPVNames.CONFIGS in self.bs.pvs)
+
+    def test_GIVEN_lists_changed_while_monitors_updated_WHEN_monitors_updated_again_THEN_config_list_pv_set(self):
+        self._create_configs(["TEST_CONFIG1"], self.clm)
+        self.clm._lists_version += 1
+        get_configs = self.clm.get_configs
+
+        def get_configs_changed_by_another_thread():
+            self.clm._lists_version += 1
+            return get_configs()
+
+        self.clm.get_configs = get_configs_changed_by_another_thread
+        self.clm.update_monitors()
+        self.clm.get_configs = get_configs
+        del self.bs.pvs[BlockserverPVNames.CONFIGS]
+
+        self.clm.update_monitors()
+
+        self.assertTrue(BlockserverPVNames.CONFIGS in self.bs.pvs)
+
+    def test_GIVEN_config_added_WHEN_monitors_updated_THEN_config_list_pv_set(self):
+        self._create_configs(["TEST_CONFIG1"], self.clm)
+        del self.bs.pvs[BlockserverPVNames.CONFIGS]
+
+        self._create_configs(["TEST_CONFIG2"], self.clm)
+
+        self.assertTrue(BlockserverPVNames.CONFIGS in self.bs.pvs)
+
+    def test_GIVEN_config_details_unchanged_WHEN_config_updated_in_list_THEN_config_details_pv_not_set_again(self):
+        configserver = self._create_inactive_config_holder()
+        configserver.set_config(create_dummy_config("TEST_CONFIG1"))
+        self.clm.update_a_config_in_list(configserver)
+        pv_name = self._correct_pv_name(self._create_pvs(["TEST_CONFIG1"], GET_CONFIG_PV)[0])
+        self.bs.pvs[pv_name] = "UNCHANGED"
+
+        self.clm.update_a_config_in_list(configserver)
+
+        self.assertEqual(self.bs.pvs[pv_name], "UNCHANGED")
@@ -526,6 +526,21 @@ class TestConfigurationXmlConverterSequence(unittest.TestCase):
             self.assertEqual(value.log_rate, expected.log_rate)
             self.assertEqual(value.log_deadband, expected.log_deadband)
 
+    def test_xml_to_groups_with_loaded_blocks_sets_group_on_blocks(self):
+        # Arrange
+        xc = self.xml_converter
+        groups = OrderedDict()
+        blocks = make_blocks()
+        root_xml = ElementTree.fromstring(GROUPS_XML)
+
+        # Act
+        xc.groups_from_xml(root_xml, groups, blocks)
+
+        # Assert
+        for grp in make_groups().values():
+            for block in grp.blocks:
+                self.assertEqual(blocks[block.lower()].group, grp.name)
+
     def test_roundtrip_group_to_xml_to_group(self):
         # Arrange
         xc = self.xml_converter
@@ -0,0 +1,77 @@
+# This file is part of the ISIS IBEX application.
+# Copyright (C) 2012-2016 Science & Technology Facilities Council.
+# All rights reserved.
+#
+# This program is distributed in the hope that it will be useful.
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License v1.0 which accompanies this distribution.
+# EXCEPT AS EXPRESSLY SET FORTH IN THE ECLIPSE PUBLIC LICENSE V1.0, THE PROGRAM
+# AND ACCOMPANYING MATERIALS ARE PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND.  See the Eclipse Public License v1.0 for more details.
+#
+# You should have received a copy of the Eclipse Public License v1.0
+# along with this program; if not, you can obtain a copy from
+# https://www.eclipse.org/org/documents/epl-v10.php or
+# http://opensource.org/licenses/eclipse-1.0.php
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from BlockServer.config.configuration import Configuration
+from BlockServer.core.constants import FILENAME_IOCS
+from BlockServer.core.file_path_manager import FILEPATH_MANAGER
+from BlockServer.core.macros import MACROS
+from BlockServer.fileIO.file_manager import ConfigurationFileManager
+
+SCHEMA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "schema")
+
+
+class TestConfigurationFileManager(unittest.TestCase):
+    def setUp(self):
+        self.config_root = tempfile.mkdtemp()
+        # FILEPATH_MANAGER is shared with the other test modules, so put its paths back once these tests have run
+        self.addCleanup(FILEPATH_MANAGER.__dict__.update, dict(FILEPATH_MANAGER.__dict__))
+        FILEPATH_MANAGER.initialise(self.config_root, self.config_root, SCHEMA_DIR)
+        self.file_manager = ConfigurationFileManager()
+
+    def tearDown(self):
+        shutil.rmtree(self.config_root)
+
+    def test_GIVEN_saved_config_with_grouped_blocks_WHEN_loaded_THEN_blocks_are_in_their_groups(self):
+        config = Configuration(MACROS)
+        config.set_name("TEST_CONFIG")
+        config.add_block("BLOCK1", "PV1", "GROUP1")
+        config.add_block("BLOCK2", "PV2", "GROUP1")
+        config.add_block("BLOCK3", "PV3", "GROUP2")
+        config.add_ioc("SIMPLE", autostart=True, restart=True)
+        self.file_manager.save_config(config, False)
+
+        loaded = self.file_manager.load_config("TEST_CONFIG", MACROS, False)
+
+        self.assertEqual(loaded.blocks["block1"].group, "GROUP1")
+        self.assertEqual(loaded.blocks["block2"].group, "GROUP1")
+        self.assertEqual(loaded.blocks["block3"].group, "GROUP2")
+        self.assertEqual([block.lower() for block in loaded.groups["group1"].blocks], ["block1", "block2"])
+        self.assertEqual([block.lower() for block in loaded.groups["group2"].blocks], ["block3"])
+
+    def test_GIVEN_saved_iocs_with_historic_simlevel_None_WHEN_loaded_THEN_simlevel_corrected_and_schema_check_passes(self):
+        config = Configuration(MACROS)
+        config.set_name("TEST_CONFIG")
+        config.add_ioc("SIMPLE1", autostart=True, restart=True)
+        config.add_ioc("SIMPLE2", autostart=True, restart=True)
+        self.file_manager.save_config(config, False)
+        iocs_path = os.path.join(FILEPATH_MANAGER.get_config_path("TEST_CONFIG"), FILENAME_IOCS)
+        with open(iocs_path) as iocs_file:
+            iocs_xml = iocs_file.read()
+        # Write the attribute with different quoting and spacing to check it is not matched as raw text
+        iocs_xml = iocs_xml.replace('simlevel="none"', "simlevel = 'None'", 1)
+        iocs_xml = iocs_xml.replace('simlevel="none"', 'simlevel="None"')
+        with open(iocs_path, "w") as iocs_file:
+            iocs_file.write(iocs_xml)
+
+        loaded = self.file_manager.load_config("TEST_CONFIG", MACROS, False)
+
+        self.assertEqual(loaded.iocs["SIMPLE1"].simlevel, "none")
+        self.assertEqual(loaded.iocs["SIMPLE2"].simlevel, "none")
@@ -61,6 +61,26 @@ class TestIocControlSequence(unittest.TestCase):
         self.assertEqual(self.ic.get_ioc_status("TESTIOC1"), "SHUTDOWN")
         self.assertEqual(self.ic.get_ioc_status("TESTIOC2"), "SHUTDOWN")
 
+    @patch("BlockServer.core.ioc_control.AlarmConfigLoader.restart_alarm_server")
+    def test_WHEN_iocs_stopped_THEN_alarm_server_restarted_once(self, restart_alarm_server):
+        self.ic.start_iocs(["TESTIOC1", "TESTIOC2", "TESTIOC3"])
+        restart_alarm_server.reset_mock()
+
+        self.ic.stop_iocs(["TESTIOC1", "TESTIOC2", "TESTIOC3"])
+
+        restart_alarm_server.assert_called_once_with(self.ic)
+
+    @patch("BlockServer.core.ioc_control.AlarmConfigLoader.restart_alarm_server")
+    def test_WHEN_only_iocs_not_to_stop_stopped_THEN_iocs_running_and_alarm_server_not_restarted(
+            self, restart_alarm_server):
+        self.ic.start_ioc(IOCS_NOT_TO_STOP[0])
+        restart_alarm_server.reset_mock()
+
+        self.ic.stop_iocs([IOCS_NOT_TO_STOP[0]])
+
+        self.assertEqual(self.ic.get_ioc_status(IOCS_NOT_TO_STOP[0]), "RUNNING")
+        restart_alarm_server.assert_not_called()
+
     def test_restart_iocs_and_get_ioc_status(self):
         self.ic.start_iocs(["TESTIOC1", "TESTIOC2"])
         self.ic.restart_iocs(["TESTIOC1", "TESTIOC2"])
@@ -1,7 +1,7 @@
 import binascii
 import unittest
 from hamcrest import *
-from server_common.utilities import compress_and_hex
+from server_common.utilities import compress_and_hex, compress_and_hex_json, convert_to_json, COMPRESSION_LEVEL
 import zlib
 
 class TestUtilities(unittest.TestCase):
@@ -9,5 +9,12 @@ class TestUtilities(unittest.TestCase):
     def test_GIVEN_string_WHEN_compressing_and_hexing_THEN_output_is_compressed_and_hexed_correctly(self):
         test = "test"
         value = compress_and_hex(test)
-        expected_value = binascii.hexlify(zlib.compress(bytes(test, encoding="utf-8")))
+        expected_value = binascii.hexlify(zlib.compress(bytes(test, encoding="utf-8"), COMPRESSION_LEVEL))
         assert_that(value, is_(expected_value))
+
+    def test_GIVEN_object_WHEN_compressing_and_hexing_as_json_THEN_output_is_same_as_compressing_and_hexing_its_json(self):
+        test = {"name": "test", "blocks": ["BLOCK_1", "BLOCK_2"], "component": None}
+        value = compress_and_hex_json(test)
+        expected_value = compress_and_hex(convert_to_json(test))
+        assert_that(value, is_(expected_value))
+
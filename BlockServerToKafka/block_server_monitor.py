@@ -19,7 +19,7 @@ from server_common.utilities import dehex_and_decompress, print_and_log
 import ca
 import json
 from BlockServer.core.macros import BLOCK_PREFIX
-from threading import RLock
+from threading import Lock
 
 
 class BlockServerMonitor:
@@ -35,7 +35,7 @@ class BlockServerMonitor:
         self.channel = CaChannel()
         self.producer = producer
         self.last_pvs = []
-        self.monitor_lock = RLock()
+        self.monitor_lock = Lock()
         try:
             self.channel.searchw(self.address)
         except CaChannelException:
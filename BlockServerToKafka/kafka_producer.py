@@ -22,6 +22,11 @@ from kafka import KafkaProducer, errors, KafkaConsumer
 from server_common.utilities import print_and_log
 from time import sleep
 
+LINGER_MS = 20
+"""Time for the producer to wait for more messages to batch with, so the remove and add messages for a config change
+are sent to the broker together"""
+
+
 class ProducerWrapper:
     """
     A wrapper class for the kafka producer.
@@ -41,7 +46,7 @@ class ProducerWrapper:
     def _set_up_producer(self, server: str):
         try:
             self.client = KafkaConsumer(bootstrap_servers=server)
-            self.producer = KafkaProducer(bootstrap_servers=server)
+            self.producer = KafkaProducer(bootstrap_servers=server, linger_ms=LINGER_MS)
             if not self.topic_exists(self.topic):
                 print_and_log(f"WARNING: topic {self.topic} does not exist. It will be created by default.")
         except errors.NoBrokersAvailable:
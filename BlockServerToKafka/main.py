@@ -43,5 +43,6 @@ if __name__ == '__main__':
     producer = ProducerWrapper(KAFKA_BROKER, KAFKA_CONFIG, KAFKA_DATA)
     monitor = BlockServerMonitor(f"{PREFIX}CS:BLOCKSERVER:BLOCKNAMES", PREFIX, producer)
 
+    # The monitor callbacks run on the channel access threads, this thread only needs to keep the process alive
     while True:
-        sleep(0.1)
+        sleep(1)
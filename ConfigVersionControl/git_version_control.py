@@ -18,8 +18,7 @@ import os
 import socket
 from functools import wraps
 from git import *
-from threading import Thread, RLock
-from time import sleep
+from threading import Thread, RLock, Event
 
 from ConfigVersionControl.git_message_provider import GitMessageProvider
 from ConfigVersionControl.version_control_exceptions import NotUnderVersionControl, NotUnderAllowedBranchException
@@ -31,6 +30,7 @@ ERROR_PREFIX = "Unable to commit to version control"
 PUSH_RETRY_INTERVAL = 10
 RETRY_INTERVAL = 0.1
 RETRY_MAX_ATTEMPTS = 100
+HOSTNAME = socket.gethostname().lower()
 
 
 class RepoFactory:
@@ -71,6 +71,8 @@ class GitVersionControl:
             self.remote = self.repo.remotes.origin
 
         self._push_lock = RLock()
+        # Set when files are known to have changed, so they are committed and pushed without waiting for the interval
+        self._push_requested = Event()
 
     @staticmethod
     def branch_allowed(branch_name):
@@ -83,7 +85,7 @@ class GitVersionControl:
             bool : Whether the branch is allowed
         """
         # Only automatically push branches named after your instrument
-        return branch_name.lower() == socket.gethostname().lower()
+        return branch_name.lower() == HOSTNAME
 
     def setup(self):
         """ Call when first starting the version control.
@@ -94,9 +96,10 @@ class GitVersionControl:
         except MaxAttemptsExceededException:
             print_and_log("Unable to remove lock from version control repository, maximum tries exceeded", "MINOR")
 
-        config_writer = self.repo.config_writer()
-        # Set git repository to ignore file permissions otherwise will reset to read only
-        config_writer.set_value("core", "filemode", False)
+        # Release the writer as soon as the value is set, so the config is written and its lock freed straight away
+        with self.repo.config_writer() as config_writer:
+            # Set git repository to ignore file permissions otherwise will reset to read only
+            config_writer.set_value("core", "filemode", False)
 
         # Start a background thread for pushing
         push_thread = Thread(target=self._commit_and_push, args=())
@@ -118,25 +121,49 @@ class GitVersionControl:
     def _commit(self):
         """ Commit changes to a repository
         """
-        num_files_changed = len(self.repo.index.diff("HEAD"))
+        # Diffing the index runs git, so only do it once
+        staged_diff = self.repo.index.diff("HEAD")
+        num_files_changed = len(staged_diff)
         if num_files_changed == 0:
             return  # nothing staged for commit
 
-        commit_comment = self._message_provider.get_commit_message(self.repo.index.diff("HEAD"))
+        commit_comment = self._message_provider.get_commit_message(staged_diff)
         self.repo.index.commit(commit_comment)
         print_and_log(f"GIT: Committed {num_files_changed} changes")
 
+    def _push_required(self):
+        """ Checks whether there is anything to push, so that a push is not made to the remote every interval when
+        nothing has changed.
+
+        Returns:
+            bool : False if the branch is known to be level with the branch it tracks on the remote, True otherwise
+        """
+        branch = self.repo.active_branch
+        tracking_branch = branch.tracking_branch()
+        if tracking_branch is None or not tracking_branch.is_valid():
+            return True
+        return any(True for _ in self.repo.iter_commits(f"{tracking_branch.path}..{branch.path}"))
+
+    def request_push(self):
+        """ Requests that the files in the repository are added, committed and pushed now rather than at the next
+        push interval.
+        """
+        self._push_requested.set()
+
     def _commit_and_push(self):
-        """ Frequently adds, commits and pushes all file currently in the repository. """
+        """ Adds, commits and pushes all file currently in the repository whenever a push is requested, and at least
+        every push interval to pick up changes made outside of the server. """
         push_interval = self.push_interval
         first_failure = True
 
         while True:
+            self._push_requested.clear()
             with self._push_lock:
                 try:
                     self._add_all_files()
                     self._commit()
-                    self.remote.push()
+                    if self._push_required():
+                        self.remote.push()
                     push_interval = self.push_interval
                     first_failure = True
 
@@ -152,7 +179,8 @@ class GitVersionControl:
                 except NotUnderAllowedBranchException as e:
                     print_and_log(f"{ERROR_PREFIX} for {self._repo_name}, {e.message}")
 
-            sleep(push_interval)
+            # A request for a push ends the wait early, including a retry wait after a failure
+            self._push_requested.wait(push_interval)
 
     @check_branch_allowed
     def _add_all_files(self):
@@ -15,7 +15,9 @@
 # http://opensource.org/licenses/eclipse-1.0.php
 
 import unittest
-from mock import Mock
+from threading import Thread
+from time import sleep, time
+from mock import Mock, MagicMock
 from ConfigVersionControl.git_version_control import GitVersionControl, SYSTEM_TEST_PREFIX
 import socket
 
@@ -33,3 +35,53 @@ class TestVersionControl(unittest.TestCase):
 
     def test_WHEN_branch_is_another_random_name_THEN_branch_not_allowed(self):
         self.assertFalse(GitVersionControl.branch_allowed("random"))
+
+    def _version_control_with_tracking_branch(self, tracking_branch, unpushed_commits=()):
+        repo = Mock()
+        repo.active_branch.tracking_branch.return_value = tracking_branch
+        repo.iter_commits.return_value = iter(unpushed_commits)
+        return GitVersionControl("", repo, "test", 1, is_local=True)
+
+    def test_GIVEN_branch_level_with_remote_WHEN_checking_push_required_THEN_push_not_required(self):
+        vc = self._version_control_with_tracking_branch(Mock())
+
+        self.assertFalse(vc._push_required())
+
+    def test_GIVEN_branch_ahead_of_remote_WHEN_checking_push_required_THEN_push_required(self):
+        vc = self._version_control_with_tracking_branch(Mock(), unpushed_commits=[Mock()])
+
+        self.assertTrue(vc._push_required())
+
+    def test_GIVEN_branch_not_tracking_a_remote_branch_WHEN_checking_push_required_THEN_push_required(self):
+        vc = self._version_control_with_tracking_branch(None)
+
+        self.assertTrue(vc._push_required())
+
+    def test_GIVEN_tracked_remote_branch_not_fetched_WHEN_checking_push_required_THEN_push_required(self):
+        tracking_branch = Mock()
+        tracking_branch.is_valid.return_value = False
+        vc = self._version_control_with_tracking_branch(tracking_branch)
+
+        self.assertTrue(vc._push_required())
+
+    def _wait_for_pushes(self, remote, count, timeout=5):
+        end = time() + timeout
+        while remote.push.call_count < count and time() < end:
+            sleep(0.01)
+        return remote.push.call_count
+
+    def test_GIVEN_push_thread_waiting_for_interval_WHEN_push_requested_THEN_pushed_without_waiting_for_interval(self):
+        repo = MagicMock()
+        repo.active_branch.__str__.return_value = socket.gethostname()
+        repo.active_branch.tracking_branch.return_value = None
+        repo.index.diff.return_value = []
+        vc = GitVersionControl("", repo, "test", 1000, is_local=True)
+        vc.remote = Mock()
+        push_thread = Thread(target=vc._commit_and_push)
+        push_thread.daemon = True
+        push_thread.start()
+        self.assertEqual(self._wait_for_pushes(vc.remote, 1), 1)
+
+        vc.request_push()
+
+        self.assertEqual(self._wait_for_pushes(vc.remote, 2), 2)
@@ -20,13 +20,12 @@ import os
 import traceback
 
 import sys
-import json
 import argparse
 
 from functools import partial
 from pcaspy import Driver
 from time import sleep
-from threading import Thread, RLock
+from threading import Thread, Lock, Event
 
 sys.path.insert(0, os.path.abspath(os.environ["MYDIRBLOCK"]))
 
@@ -38,7 +37,7 @@ from DatabaseServer.moxa_data import MoxaData, MoxaDataSource
 
 from genie_python.mysql_abstraction_layer import SQLAbstraction
 from server_common.utilities import compress_and_hex, print_and_log, set_logger, convert_to_json, \
-    dehex_and_decompress, char_waveform
+    compress_and_hex_json, dehex_and_decompress, char_waveform
 from server_common.channel_access_server import CAServer
 from server_common.constants import IOCS_NOT_TO_STOP
 from server_common.ioc_data import IOCData
@@ -59,6 +58,13 @@ LOG_TARGET = "DBSVR"
 INFO_MSG = "INFO"
 MAJOR_MSG = "MAJOR"
 
+MONITOR_UPDATE_INTERVAL = 1
+"""Maximum time in seconds between updates of the IOC monitors"""
+
+MONITORED_PVS = [DbPVNames.IOCS, DbPVNames.HIGH_INTEREST, DbPVNames.MEDIUM_INTEREST, DbPVNames.FACILITY,
+                 DbPVNames.ACTIVE_PVS, DbPVNames.ALL_PVS, DbPVNames.MOXA_MAPPINGS]
+"""PVs which are kept up to date by the monitor thread"""
+
 
 class DatabaseServer(Driver):
     """
@@ -84,13 +90,19 @@ class DatabaseServer(Driver):
         self._ca_server = ca_server
         self._options_holder = OptionsHolder(options_folder, OptionsLoader())
         self._pv_info = self._generate_pv_acquisition_info()
+        # Look up the method for each PV once rather than through its info on every read
+        self._get_methods = {pv: info['get'] for pv, info in self._pv_info.items()}
         self._iocs = ioc_data
         self._ed = exp_data
         self._moxa_data = moxa_data
+        self._monitor_update_requested = Event()
+        self._monitor_json = dict()
+        # The last JSON and compressed values for each PV, to avoid recompressing unchanged data for reads and monitors
+        self._encoded_values = dict()
 
         if self._iocs is not None and not test_mode:
             # Start a background thread for keeping track of running IOCs
-            self.monitor_lock = RLock()
+            self.monitor_lock = Lock()
             monitor_thread = Thread(target=self._update_ioc_monitors, args=())
             monitor_thread.daemon = True  # Daemonise thread
             monitor_thread.start()
@@ -154,9 +166,37 @@ class DatabaseServer(Driver):
         Return:
             The data, compressed and hexed.
         """
-        data = self._pv_info[pv]['get']()
-        data = compress_and_hex(str(json.dumps(data)))
-        self._check_pv_capacity(pv, len(data), self._blockserver_prefix)
+        return self._encode_json_for_pv(pv, self._get_json_for_pv(pv))
+
+    def _get_json_for_pv(self, pv: str) -> str:
+        """
+        Get the data for the given pv name as an uncompressed JSON string.
+
+        Args:
+            pv: The name of the PV to get the data for.
+
+        Return:
+            The data as JSON.
+        """
+        return convert_to_json(self._get_methods[pv]())
+
+    def _encode_json_for_pv(self, pv: str, json_data: str) -> bytes:
+        """
+        Compress and hex the JSON data for the given pv name, checking that it fits in the PV. The previous result is
+        reused if the data is unchanged.
+
+        Args:
+            pv: The name of the PV the data is for.
+            json_data: The data as JSON.
+
+        Return:
+            The data, compressed and hexed.
+        """
+        previous_json, data = self._encoded_values.get(pv, (None, None))
+        if previous_json != json_data:
+            data = compress_and_hex(json_data)
+            self._check_pv_capacity(pv, len(data), self._blockserver_prefix)
+            self._encoded_values[pv] = (json_data, data)
         return data
 
     def read(self, reason: str) -> str:
@@ -169,7 +209,10 @@ class DatabaseServer(Driver):
         Returns:
             A compressed and hexed JSON formatted string that gives the desired information based on reason.
         """
-        return self.get_data_for_pv(reason) if reason in self._pv_info.keys() else self.getParam(reason)
+        if reason in self._monitor_json:
+            # The monitor thread keeps this value at most MONITOR_UPDATE_INTERVAL old, so no need to fetch it again
+            return self.getParam(reason)
+        return self.get_data_for_pv(reason) if reason in self._get_methods else self.getParam(reason)
 
     def write(self, reason: str, value: str) -> bool:
         """
@@ -189,8 +232,9 @@ class DatabaseServer(Driver):
                 self._ed.update_username(dehex_and_decompress(value.encode('utf-8')).decode('utf-8'))
             elif reason == 'UPDATE_MM':
                 self._moxa_data.update_mappings()
+                self._monitor_update_requested.set()
         except Exception as e:
-            value = compress_and_hex(convert_to_json("Error: " + str(e)))
+            value = compress_and_hex_json("Error: " + str(e))
             print_and_log(str(e), MAJOR_MSG)
         # store the values
         self.setParam(reason, value)
@@ -198,21 +242,24 @@ class DatabaseServer(Driver):
 
     def _update_ioc_monitors(self) -> None:
         """
-        Updates all the PVs that hold information on the IOCS and their associated PVs.
+        Updates all the PVs that hold information on the IOCS and their associated PVs. Updates happen every
+        MONITOR_UPDATE_INTERVAL seconds, or sooner if an update is requested.
         """
         while True:
             if self._iocs is not None:
                 self._iocs.update_iocs_status()
-                for pv in [DbPVNames.IOCS, DbPVNames.HIGH_INTEREST, DbPVNames.MEDIUM_INTEREST, DbPVNames.FACILITY,
-                           DbPVNames.ACTIVE_PVS, DbPVNames.ALL_PVS, DbPVNames.MOXA_MAPPINGS]:
-                    encoded_data = self.get_data_for_pv(pv)
-                    # No need to update monitors if data hasn't changed
-                    if not self.getParam(pv) == encoded_data:
-                        self.setParam(pv, encoded_data)
+                for pv in MONITORED_PVS:
+                    json_data = self._get_json_for_pv(pv)
+                    # No need to compress the data or update monitors if it hasn't changed since the last tick
+                    if self._monitor_json.get(pv) != json_data:
+                        # Set the value before recording the JSON, reads use the value once the JSON is recorded
+                        self.setParam(pv, self._encode_json_for_pv(pv, json_data))
+                        self._monitor_json[pv] = json_data
                 # Update them
                 with self.monitor_lock:
                     self.updatePVs()
-            sleep(1)
+            self._monitor_update_requested.wait(MONITOR_UPDATE_INTERVAL)
+            self._monitor_update_requested.clear()
 
     def _check_pv_capacity(self, pv: str, size: int, prefix: str) -> None:
         """
@@ -251,7 +298,8 @@ class DatabaseServer(Driver):
         if self._iocs is not None:
             pv_data = get_method(*get_args)
             if replace_pv_prefix:
-                pv_data = [p.replace(MACROS["$(MYPVPREFIX)"], "") for p in pv_data]
+                pv_prefix = MACROS["$(MYPVPREFIX)"]
+                pv_data = [p.replace(pv_prefix, "") for p in pv_data]
             return pv_data
         else:
             return []
@@ -347,9 +395,9 @@ if __name__ == '__main__':
 
     OPTIONS_DIR = os.path.abspath(args.options_dir[0])
     print_and_log("OPTIONS DIRECTORY = %s" % OPTIONS_DIR, INFO_MSG, LOG_TARGET)
-    if not os.path.isdir(os.path.abspath(OPTIONS_DIR)):
+    if not os.path.isdir(OPTIONS_DIR):
         # Create it then
-        os.makedirs(os.path.abspath(OPTIONS_DIR))
+        os.makedirs(OPTIONS_DIR)
 
     SERVER = CAServer(BLOCKSERVER_PREFIX)
     SERVER.createPV(BLOCKSERVER_PREFIX, DatabaseServer.generate_pv_info())
@@ -1,13 +1,16 @@
 import os
-from collections import OrderedDict
 from typing import Dict, Tuple, List
-import socket, time
-from threading import Thread, RLock
+import socket, struct, time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread, Lock
 
 from server_common.utilities import print_and_log, SEVERITY
 
 from server_common.snmpWalker import walk
 
+if os.name == "nt":
+    import winreg as wrg
+
 REG_KEY_NPDRV = r"SYSTEM\\CurrentControlSet\\Services\\npdrv\\Parameters"
 REG_DIR_NPDRV2 = r"SYSTEM\\CurrentControlSet\\Enum\\ROOT\\PORTS"
 GET_MOXA_IPS = """
@@ -22,11 +25,11 @@ WHERE moxa_name = %s;
 """
 
 INSERT_TO_IPS = """
-INSERT INTO moxa_details.moxa_ips (moxa_name, moxa_ip) VALUES (%s, %s);
+INSERT INTO moxa_details.moxa_ips (moxa_name, moxa_ip) VALUES {values};
 """
 
 INSERT_TO_PORTS = """
-INSERT INTO moxa_details.port_mappings (moxa_name, moxa_port, com_port) VALUES (%s, %s, %s);"""
+INSERT INTO moxa_details.port_mappings (moxa_name, moxa_port, com_port) VALUES {values};"""
 
 DELETE_IPS = """
 DELETE FROM moxa_details.moxa_ips;"""
@@ -34,6 +37,9 @@ DELETE FROM moxa_details.moxa_ips;"""
 DELETE_PORTS = """
 DELETE FROM moxa_details.port_mappings;"""
 
+MAX_HOSTNAME_LOOKUP_THREADS = 16
+"""Maximum number of reverse DNS lookups to run at once when reading the moxa mappings"""
+
 SYSTEM_MIBS = ["DISMAN-EXPRESSION-MIB::sysUpTimeInstance", "SNMPv2-MIB::sysName"]
 PORT_MIBS = ["IF-MIB::ifOperStatus", "IF-MIB::ifSpeed", "IF-MIB::ifInOctets", "IF-MIB::ifOutOctets"]
 
@@ -63,18 +69,38 @@ class MoxaDataSource(object):
         """
         # Get as a plain list of lists
         values = [list(element) for element in self.mysql_abstraction_layer.query(sqlquery, bind_vars)]
-
-        # Convert any bytearrays
-        for i, pv in enumerate(values):
-            for j, element in enumerate(pv):
+        if not values:
+            return values
+
+        # Convert any bytearrays. A column holds the same type in every row (or None for NULL), so only the columns
+        # which are a bytearray or None in the first row need to be checked
+        columns_to_check = [j for j, element in enumerate(values[0]) if element is None or type(element) == bytearray]
+        for pv in values:
+            for j in columns_to_check:
+                element = pv[j]
                 if type(element) == bytearray:
-                    values[i][j] = element.decode("utf-8")
+                    pv[j] = element.decode("utf-8")
         return values
     
     def _delete_all(self):
         self.mysql_abstraction_layer.update(DELETE_PORTS)
         self.mysql_abstraction_layer.update(DELETE_IPS)
 
+    def _insert_rows(self, sql_template, rows):
+        """
+        Inserts all the rows with a single multi-row INSERT rather than one statement per row.
+
+        Args:
+            sql_template: The INSERT statement with a {values} placeholder for the row bindings
+            rows: The rows to insert, each a tuple of values for the columns
+        """
+        if not rows:
+            return
+        row_binding = "({})".format(self.mysql_abstraction_layer.generate_in_binding(len(rows[0])))
+        values_binding = ", ".join([row_binding] * len(rows))
+        bound_variables = tuple(value for row in rows for value in row)
+        self.mysql_abstraction_layer.update(sql_template.format(values=values_binding), bound_variables)
+
     """
     Iterates through the map of ip to hostname and physical port to COM ports and inserts the mappings into the sql instance. 
 
@@ -85,16 +111,18 @@ class MoxaDataSource(object):
     def insert_mappings(self, moxa_ip_name_dict, moxa_ports_dict):
         print_and_log("inserting moxa mappings to SQL")
         self._delete_all()
+        ip_rows = []
         for moxa_name, moxa_ip in moxa_ip_name_dict.items():
             print_and_log(f"moxa name: {moxa_name} - IP: {moxa_ip}")
-            self.mysql_abstraction_layer.update(INSERT_TO_IPS, (moxa_name, moxa_ip))
+            ip_rows.append((moxa_name, moxa_ip))
+        self._insert_rows(INSERT_TO_IPS, ip_rows)
 
+        port_rows = []
         for moxa_name, ports in moxa_ports_dict.items():           
             for phys_port, com_port in ports:
-            # phys_port = ports[0]
-            # com_port = ports[1]
                 print_and_log(f"moxa name: {moxa_name}, phys port: {phys_port}, com_port: {com_port}")
-                self.mysql_abstraction_layer.update(INSERT_TO_PORTS, (moxa_name, str(phys_port), str(com_port)))
+                port_rows.append((moxa_name, str(phys_port), str(com_port)))
+        self._insert_rows(INSERT_TO_PORTS, port_rows)
 
 class MoxaData():
 
@@ -112,10 +140,10 @@ class MoxaData():
         """
         self._moxa_data_source = data_source
         self._prefix = prefix
-        self.moxa_map = OrderedDict()
+        self.moxa_map = {}
         # insert mappings initially
         self.update_mappings()
-        self._snmp_lock = RLock()
+        self._snmp_lock = Lock()
         self._snmp_map = {}
         snmp_thread = Thread(target=self._update_snmp, args=())
         snmp_thread.daemon = True  # Daemonise thread
@@ -127,7 +155,7 @@ class MoxaData():
     def update_mappings(self):
         print_and_log("updating moxa mappings")
         self._mappings = self._get_mappings()
-        self._moxa_data_source.insert_mappings(*self._get_mappings())
+        self._moxa_data_source.insert_mappings(*self._mappings)
 
     """
     Returns the IP to hostname and IP to port mappings as a string representation for use with the MOXA_MAPPINGS PV
@@ -175,14 +203,30 @@ class MoxaData():
             time.sleep(30)
     
     def _get_moxa_num(self):
-        return str(len(self._mappings[0].keys()))
+        return str(len(self._mappings[0]))
     
     def _get_hostname(self, ip_addr):
         try:
             return socket.gethostbyaddr(ip_addr)[0]
         except socket.herror:
             return "unknown"
-        
+
+    def _get_hostnames(self, ip_addrs):
+        """
+        Looks up the hostnames of the given IP addresses. The lookups are blocking so are done concurrently, each
+        address is only looked up once.
+
+        Args:
+            ip_addrs (Iterable[str]): The IP addresses to look up
+
+        Returns:
+            Dict[str, str]: The hostname for each IP address, "unknown" if it could not be found
+        """
+        unique_ip_addrs = list(dict.fromkeys(ip_addrs))
+        if not unique_ip_addrs:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(MAX_HOSTNAME_LOOKUP_THREADS, len(unique_ip_addrs))) as executor:
+            return dict(zip(unique_ip_addrs, executor.map(self._get_hostname, unique_ip_addrs)))
 
 
     def _get_mappings(self) -> Tuple[Dict[str, str], Dict[int, List[Tuple[int, int]]]]:
@@ -191,8 +235,6 @@ class MoxaData():
         moxa_name_ip_dict = dict()
         moxa_ports_dict = dict()
         if os.name == "nt":
-            import winreg as wrg
-
             location = wrg.HKEY_LOCAL_MACHINE
 
             using_npdrv2 = False
@@ -210,41 +252,47 @@ class MoxaData():
                     # This is what Nport Windows Driver manager uses. It uses a subkey for each port mappping,
                     # each of which has an ip address referenced. It doesn't seem to have a physical port number
                     # as the ports are added individually, so we have to modulo the port number. 
-                    for port_num in range(0, ports_count):
-                        port_subkey = f"{port_num:04d}"
-                        port_reg = wrg.OpenKeyEx(ports_path, port_subkey)
-                        device_params = wrg.OpenKeyEx(port_reg, "Device Parameters")
-                        ip_addr = wrg.QueryValueEx(device_params, "IPAddress1")[0]
-                        com_num = wrg.QueryValueEx(device_params, "COMNO")[0]
-                        hostname = self._get_hostname(ip_addr)
+                    port_details = []
+                    with ports_path:
+                        for port_num in range(0, ports_count):
+                            port_subkey = f"{port_num:04d}"
+                            with wrg.OpenKeyEx(ports_path, f"{port_subkey}\\Device Parameters") as device_params:
+                                ip_addr = wrg.QueryValueEx(device_params, "IPAddress1")[0]
+                                com_num = wrg.QueryValueEx(device_params, "COMNO")[0]
+                            port_details.append((port_num, ip_addr, com_num))
+
+                    hostnames = self._get_hostnames(ip_addr for _, ip_addr, _ in port_details)
+                    for port_num, ip_addr, com_num in port_details:
+                        hostname = hostnames[ip_addr]
 
                         moxa_name_ip_dict[hostname] = ip_addr
 
-                        if hostname not in moxa_ports_dict.keys():
-                            moxa_ports_dict[hostname] = list()
                         # Modulo by 16 here as we want the 2nd moxa's first port_num to be 1 rather
                         # than 17 as it's the first port on the second moxa
                         port_num_respective = port_num % 16 
-                        moxa_ports_dict[hostname].append((port_num_respective + 1, com_num))
+                        moxa_ports_dict.setdefault(hostname, []).append((port_num_respective + 1, com_num))
 
                 else: 
                     # This is what Nport Administrator uses. It lays out each Moxa that is added to "Servers" which contains a few bytes
                     # and lays things out in a subkey for each.
-                    params = wrg.OpenKeyEx(location,REG_KEY_NPDRV)
-                    server_count = wrg.QueryValueEx(params, "Servers")[0]
-
-                    for server_num in range(1, server_count+1):
-                        soft = wrg.OpenKeyEx(location,f"{REG_KEY_NPDRV}\\Server{server_num}")
-                        ip_addr_bytes = wrg.QueryValueEx(soft,"IPAddress")[0].to_bytes(4)
-                        ip_addr = ".".join([str(int(x)) for x in ip_addr_bytes])
-                        hostname = self._get_hostname(ip_addr)
+                    with wrg.OpenKeyEx(location,REG_KEY_NPDRV) as params:
+                        server_count = wrg.QueryValueEx(params, "Servers")[0]
+
+                        server_details = []
+                        for server_num in range(1, server_count+1):
+                            with wrg.OpenKeyEx(params, f"Server{server_num}") as soft:
+                                # The address is stored as a DWORD with the first octet in the most significant byte
+                                ip_addr = socket.inet_ntoa(struct.pack(">I", wrg.QueryValueEx(soft,"IPAddress")[0]))
+                                server_details.append((ip_addr, wrg.QueryValueEx(soft,"COMNO")[0]))
+
+                    hostnames = self._get_hostnames(ip_addr for ip_addr, _ in server_details)
+                    for ip_addr, com_nos in server_details:
+                        hostname = hostnames[ip_addr]
                         moxa_name_ip_dict[hostname] = ip_addr
                         print_and_log(f"IP {ip_addr} hostname {hostname}")
                         start_num_com = 1
-                        com_nums = enumerate(wrg.QueryValueEx(soft,"COMNO")[0], start_num_com)
-                        moxa_ports_dict[hostname] = list(com_nums)
-                        for count, value in com_nums: 
-                            print_and_log(f"physical port {count} COM number {value}")
+                        # each port mapping is logged when it is inserted into the database
+                        moxa_ports_dict[hostname] = list(enumerate(com_nos, start_num_com))
             except FileNotFoundError as e:
                 print_and_log(f"Error reading registry for moxa mapping information: {str(e)}", severity=SEVERITY.MAJOR)
 
@@ -15,6 +15,8 @@ from __future__ import print_function, absolute_import, division, unicode_litera
 # https://www.eclipse.org/org/documents/epl-v10.php or
 # http://opensource.org/licenses/eclipse-1.0.php
 
+from functools import lru_cache
+
 from server_common.channel_access import ChannelAccess
 from server_common.utilities import print_and_log
 
@@ -23,8 +25,9 @@ class ProcServWrapper(object):
     """A wrapper for ProcSev to allow for control of IOCs"""
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def generate_prefix(prefix: str, ioc: str) -> str:
-        """Creates a PV based on the given prefix and IOC name
+        """Creates a PV based on the given prefix and IOC name. There is a fixed set of IOCs so the PVs are cached.
 
         Args:
             prefix: The prefix of the instrument the IOC is being run on
@@ -32,6 +35,18 @@ class ProcServWrapper(object):
         """
         return "{}CS:PS:{}".format(prefix, ioc)
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _generate_status_pv(prefix: str, ioc: str) -> str:
+        """Creates the status PV for the given prefix and IOC name. The status of every IOC is read each time the IOC
+        monitors are updated, so these PVs are cached.
+
+        Args:
+            prefix: The prefix of the instrument the IOC is being run on
+            ioc: The name of the requested IOC
+        """
+        return ProcServWrapper.generate_prefix(prefix, ioc) + ":STATUS"
+
     def start_ioc(self, prefix: str, ioc: str) -> None:
         """Starts the specified IOC
 
@@ -72,7 +87,7 @@ class ProcServWrapper(object):
         Returns:
             The status of the requested IOC
         """
-        pv = self.generate_prefix(prefix, ioc) + ":STATUS"
+        pv = self._generate_status_pv(prefix, ioc)
         ans = ChannelAccess.caget(pv, as_string=True)
         if ans is None:
             raise IOError("Could not find IOC (%s)" % pv)
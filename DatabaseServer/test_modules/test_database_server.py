@@ -30,7 +30,7 @@ from DatabaseServer.database_server import DatabaseServer
 from server_common.mocks.mock_ca_server import MockCAServer
 from server_common.mocks.mock_ioc_data_source import MockIocDataSource, IOCS
 from server_common.test_modules.test_ioc_data import HIGH_PV_NAMES, MEDIUM_PV_NAMES, LOW_PV_NAMES, FACILITY_PV_NAMES
-from server_common.utilities import dehex_and_decompress, set_logger
+from server_common.utilities import dehex_and_decompress, set_logger, compress_and_hex
 from DatabaseServer.mocks.mock_procserv_utils import MockProcServWrapper
 from server_common.ioc_data import IOCData
 from DatabaseServer.mocks.mock_exp_data import MockExpData
@@ -91,3 +91,35 @@ class TestDatabaseServer(unittest.TestCase):
         for name in IOCS:
             self.assertTrue(name in pv_data, msg="{name} in {pv_names}".format(name=name, pv_names=pv_data))
 
+
+    @unittest.skipIf(IS_LINUX, "DB server not configured to run properly on Linux build")
+    def test_GIVEN_data_unchanged_WHEN_pv_read_twice_THEN_data_only_compressed_once(self):
+        self.moxa_data._get_mappings_str.return_value = [["moxa1", "COM1"]]
+
+        with mock.patch("DatabaseServer.database_server.compress_and_hex", wraps=compress_and_hex) as compress:
+            first_read = self.db_server.read(DatabasePVNames.MOXA_MAPPINGS)
+            second_read = self.db_server.read(DatabasePVNames.MOXA_MAPPINGS)
+
+        self.assertEqual(first_read, second_read)
+        self.assertEqual(compress.call_count, 1)
+
+    @unittest.skipIf(IS_LINUX, "DB server not configured to run properly on Linux build")
+    def test_GIVEN_data_changed_WHEN_pv_read_again_THEN_new_data_returned(self):
+        self.moxa_data._get_mappings_str.return_value = [["moxa1", "COM1"]]
+        self.db_server.read(DatabasePVNames.MOXA_MAPPINGS)
+        self.moxa_data._get_mappings_str.return_value = [["moxa1", "COM2"]]
+
+        pv_data = json.loads(dehex_and_decompress(self.db_server.read(DatabasePVNames.MOXA_MAPPINGS)))
+
+        self.assertEqual(pv_data, [["moxa1", "COM2"]])
+
+    @unittest.skipIf(IS_LINUX, "DB server not configured to run properly on Linux build")
+    def test_GIVEN_pv_updated_by_monitor_WHEN_pv_read_THEN_monitor_value_returned_without_fetching_data(self):
+        self.db_server._monitor_json[DatabasePVNames.MOXA_MAPPINGS] = '[["moxa1", "COM1"]]'
+
+        with mock.patch.object(self.db_server, "getParam", return_value=b"monitor value") as get_param:
+            result = self.db_server.read(DatabasePVNames.MOXA_MAPPINGS)
+
+        self.assertEqual(result, b"monitor value")
+        get_param.assert_called_once_with(DatabasePVNames.MOXA_MAPPINGS)
+        self.moxa_data._get_mappings_str.assert_not_called()
@@ -0,0 +1,80 @@
+# This file is part of the ISIS IBEX application.
+# Copyright (C) 2012-2016 Science & Technology Facilities Council.
+# All rights reserved.
+#
+# This program is distributed in the hope that it will be useful.
+# This program and the accompanying materials are made available under the
+# terms of the Eclipse Public License v1.0 which accompanies this distribution.
+# EXCEPT AS EXPRESSLY SET FORTH IN THE ECLIPSE PUBLIC LICENSE V1.0, THE PROGRAM
+# AND ACCOMPANYING MATERIALS ARE PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND.  See the Eclipse Public License v1.0 for more details.
+#
+# You should have received a copy of the Eclipse Public License v1.0
+# along with this program; if not, you can obtain a copy from
+# https://www.eclipse.org/org/documents/epl-v10.php or
+# http://opensource.org/licenses/eclipse-1.0.php
+
+import unittest
+
+from mock import Mock, call, patch
+
+from DatabaseServer.moxa_data import MoxaData, MoxaDataSource, INSERT_TO_IPS, INSERT_TO_PORTS, DELETE_IPS, \
+    DELETE_PORTS
+from server_common.loggers.logger import Logger
+from server_common.utilities import set_logger
+
+# Use a dummy logger during tests as real logger requires log server
+set_logger(Logger())
+
+
+class TestMoxaDataSource(unittest.TestCase):
+    def setUp(self):
+        self.mysql_abstraction_layer = Mock()
+        self.mysql_abstraction_layer.generate_in_binding.side_effect = lambda count: ", ".join(["%s"] * count)
+        self.moxa_data_source = MoxaDataSource(self.mysql_abstraction_layer)
+
+    def test_GIVEN_mappings_WHEN_inserted_THEN_one_insert_per_table_with_all_rows_bound(self):
+        moxa_ip_name_dict = {"MOXA1": "127.0.0.1", "MOXA2": "127.0.0.2"}
+        moxa_ports_dict = {"MOXA1": [(1, 5), (2, 6)]}
+
+        self.moxa_data_source.insert_mappings(moxa_ip_name_dict, moxa_ports_dict)
+
+        self.assertEqual(self.mysql_abstraction_layer.update.call_args_list, [
+            call(DELETE_PORTS),
+            call(DELETE_IPS),
+            call(INSERT_TO_IPS.format(values="(%s, %s), (%s, %s)"), ("MOXA1", "127.0.0.1", "MOXA2", "127.0.0.2")),
+            call(INSERT_TO_PORTS.format(values="(%s, %s, %s), (%s, %s, %s)"),
+                 ("MOXA1", "1", "5", "MOXA1", "2", "6")),
+        ])
+
+    def test_GIVEN_no_mappings_WHEN_inserted_THEN_tables_cleared_and_nothing_inserted(self):
+        self.moxa_data_source.insert_mappings({}, {})
+
+        self.assertEqual(self.mysql_abstraction_layer.update.call_args_list, [call(DELETE_PORTS), call(DELETE_IPS)])
+
+
+class TestMoxaDataHostnames(unittest.TestCase):
+    def setUp(self):
+        # Don't construct a real MoxaData as that reads the registry and starts the SNMP thread
+        self.moxa_data = MoxaData.__new__(MoxaData)
+        self.moxa_data._get_hostname = Mock(side_effect=lambda ip_addr: f"host_{ip_addr}")
+
+    def test_GIVEN_ip_addresses_WHEN_hostnames_looked_up_THEN_hostname_returned_for_each_address(self):
+        hostnames = self.moxa_data._get_hostnames(["127.0.0.1", "127.0.0.2"])
+
+        self.assertEqual(hostnames, {"127.0.0.1": "host_127.0.0.1", "127.0.0.2": "host_127.0.0.2"})
+
+    def test_GIVEN_duplicate_ip_addresses_WHEN_hostnames_looked_up_THEN_each_address_looked_up_once(self):
+        hostnames = self.moxa_data._get_hostnames(["127.0.0.1", "127.0.0.2", "127.0.0.1", "127.0.0.1"])
+
+        self.assertEqual(hostnames, {"127.0.0.1": "host_127.0.0.1", "127.0.0.2": "host_127.0.0.2"})
+        self.assertEqual(self.moxa_data._get_hostname.call_count, 2)
+        self.moxa_data._get_hostname.assert_has_calls([call("127.0.0.1"), call("127.0.0.2")], any_order=True)
+
+    def test_GIVEN_no_ip_addresses_WHEN_hostnames_looked_up_THEN_empty_and_no_executor_created(self):
+        with patch("DatabaseServer.moxa_data.ThreadPoolExecutor") as executor:
+            hostnames = self.moxa_data._get_hostnames(iter([]))
+
+        self.assertEqual(hostnames, {})
+        executor.assert_not_called()
+        self.moxa_data._get_hostname.assert_not_called()
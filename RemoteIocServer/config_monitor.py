@@ -3,17 +3,17 @@ Module to help monitor and react to the configuration on the instrument server.
 """
 from __future__ import print_function, unicode_literals, division, absolute_import
 
-import json
 import zlib
 import threading
 from functools import wraps
+from itertools import chain
 
 from BlockServer.config.configuration import Configuration
 from BlockServer.core.file_path_manager import FILEPATH_MANAGER
 from BlockServer.fileIO.file_manager import ConfigurationFileManager
 from RemoteIocServer.utilities import print_and_log, get_hostname_from_prefix, THREADPOOL
 from server_common.channel_access import ChannelAccess
-from server_common.utilities import dehex_and_decompress_waveform
+from server_common.utilities import dehex_and_decompress_waveform, convert_from_json
 from BlockServer.config.ioc import IOC
 
 
@@ -86,6 +86,7 @@ class ConfigurationMonitor(object):
         self._remote_pv_prefix = None
         self._remote_hostname = None
         self._file_manager = ConfigurationFileManager()
+        self._last_config = None
 
     def set_remote_pv_prefix(self, remote_pv_prefix):
         """
@@ -108,6 +109,8 @@ class ConfigurationMonitor(object):
         Monitors the PV and calls the provided callback function when the value changes
         """
         self._stop_monitoring()
+        # The files written depend on the remote host, so always write the first config from a new monitor
+        self._last_config = None
         self._monitor = _EpicsMonitor("{}CS:BLOCKSERVER:GET_CURR_CONFIG_DETAILS".format(self._remote_pv_prefix))
         self._monitor.start(callback=self._config_updated)
 
@@ -120,7 +123,11 @@ class ConfigurationMonitor(object):
     def _config_updated(self, value, *_, **__):
         try:
             new_config = dehex_and_decompress_waveform(value)
+            if new_config == self._last_config:
+                # Monitors can repost the same config, e.g. on reconnect, in which case the files and IOCs are current
+                return
             self.write_new_config_as_xml(new_config)
+            self._last_config = new_config
             THREADPOOL.submit(self.restart_iocs_callback_func)
         except (TypeError, ValueError, IOError, zlib.error) as e:
             print_and_log("ConfigMonitor: Config JSON from instrument not decoded correctly: {}: {}"
@@ -137,7 +144,7 @@ class ConfigurationMonitor(object):
             config_json_as_str: remote configuration on which to base the xml
         """
         print_and_log("ConfigMonitor: Got new config monitor, writing new config files")
-        config_json = json.loads(config_json_as_str)
+        config_json = convert_from_json(config_json_as_str)
 
         config = self._create_config_from_instrument_config(config_json)
 
@@ -152,20 +159,13 @@ class ConfigurationMonitor(object):
         config.set_name(REMOTE_IOC_CONFIG_NAME)
         config.meta.description = "Configuration for remote IOC"
 
-        iocs_list = []
-
-        if "component_iocs" in config_from_json and config_from_json["component_iocs"] is not None:
-            for ioc in config_from_json["component_iocs"]:
-                if ioc["remotePvPrefix"] == self._local_pv_prefix:  # If the IOC is meant to run on this machine...
-                    iocs_list.append(ioc)
-
-        if "iocs" in config_from_json and config_from_json["iocs"] is not None:
-            for ioc in config_from_json["iocs"]:
-                if ioc["remotePvPrefix"] == self._local_pv_prefix:  # If the IOC is meant to run on this machine...
-                    iocs_list.append(ioc)
+        # Component IOCs first so that IOCs in the configuration itself take precedence
+        all_iocs = chain(config_from_json.get("component_iocs") or (), config_from_json.get("iocs") or ())
 
         iocs = {}
-        for ioc in iocs_list:
+        for ioc in all_iocs:
+            if ioc["remotePvPrefix"] != self._local_pv_prefix:  # Only IOCs meant to run on this machine
+                continue
             name = ioc["name"]
             macros = {macro["name"]: {"name": macro["name"], "value": macro["value"]} for macro in ioc["macros"]}
             macros["ACF_IH1"] = {"name": "ACF_IH1", "value": self._remote_hostname}
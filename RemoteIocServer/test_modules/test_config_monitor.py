@@ -83,6 +83,38 @@ class TestConfigMonitor(unittest.TestCase):
         write_new.assert_called_once()
         print_and_log.assert_not_called()
 
+    @patch("RemoteIocServer.config_monitor.THREADPOOL")
+    @patch("RemoteIocServer.config_monitor.dehex_and_decompress_waveform", return_value="abc")
+    @patch("RemoteIocServer.config_monitor._EpicsMonitor")
+    def test_GIVEN_config_written_WHEN_config_updated_called_with_same_value_THEN_config_not_rewritten(
+            self, epicsmonitor, dehex, threadpool):
+
+        monitor = ConfigurationMonitor(LOCAL_TEST_PREFIX, lambda *a, **k: None)
+        write_new = MagicMock()
+        monitor.write_new_config_as_xml = write_new
+        monitor._config_updated([0])
+        monitor._config_updated([0])
+
+        write_new.assert_called_once()
+        threadpool.submit.assert_called_once()
+
+    @patch("RemoteIocServer.config_monitor.THREADPOOL")
+    @patch("RemoteIocServer.config_monitor.get_hostname_from_prefix")
+    @patch("RemoteIocServer.config_monitor.dehex_and_decompress_waveform", return_value="abc")
+    @patch("RemoteIocServer.config_monitor._EpicsMonitor")
+    def test_GIVEN_config_written_WHEN_remote_pv_prefix_changed_and_same_config_received_THEN_config_rewritten(
+            self, epicsmonitor, dehex, get_hostname, threadpool):
+        get_hostname.return_value = "localhost"
+        monitor = ConfigurationMonitor(LOCAL_TEST_PREFIX, lambda *a, **k: None)
+        write_new = MagicMock()
+        monitor.write_new_config_as_xml = write_new
+        monitor._config_updated([0])
+
+        monitor.set_remote_pv_prefix(REMOTE_TEST_PREFIX)
+        monitor._config_updated([0])
+
+        self.assertEqual(write_new.call_count, 2)
+
     @patch("RemoteIocServer.config_monitor.print_and_log")
     @patch("RemoteIocServer.config_monitor.dehex_and_decompress_waveform", side_effect=ValueError)
     @patch("RemoteIocServer.config_monitor._EpicsMonitor")
@@ -27,7 +27,9 @@ sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 # Standard imports
 from pcaspy import Driver, SimpleServer
 import argparse
-from threading import Thread, RLock
+from threading import Thread, RLock, local
+from contextlib import contextmanager
+from functools import wraps, lru_cache
 from time import sleep, time
 import datetime
 from BlockServer.core.file_path_manager import FILEPATH_MANAGER
@@ -36,7 +38,7 @@ from BlockServer.core.active_config_holder import ActiveConfigHolder
 from BlockServer.core.inactive_config_holder import InactiveConfigHolder
 from server_common.channel_access_server import CAServer
 from server_common.utilities import compress_and_hex, dehex_and_decompress, print_and_log, set_logger, \
-    convert_to_json, convert_from_json, char_waveform
+    convert_to_json, convert_from_json, char_waveform, compress_and_hex_json
 from BlockServer.core.macros import MACROS, CONTROL_SYSTEM_PREFIX, BLOCK_PREFIX, PVPREFIX_MACRO
 from server_common.pv_names import BlockserverPVNames
 from BlockServer.core.config_list_manager import ConfigListManager
@@ -63,37 +65,58 @@ CURR_CONFIG_NAME_SEVR_VALUE = 0
 CONFIG_PUSH_TIME = 300 # 5 minutes
 INST_SCRIPT_PUSH_TIME = 604800 # 7 days
 
+# The response stored on a write PV when the write succeeds, precomputed as it is the same for every write
+OK_RESPONSE = compress_and_hex_json("OK")
+
 # This IOC gets special treatment as it needs to be reloaded on every single config change, regardless of whether
 # it's macros have changed or not. For details see https://github.com/ISISComputingGroup/IBEX/issues/5590
 CAEN_DISCRIMINATOR_IOC_NAME = "CAENV895_01"
 
-# For documentation on these commands see the wiki
-initial_dbs = {
-    BlockserverPVNames.BLOCKNAMES: char_waveform(16000),
-    BlockserverPVNames.HEARTBEAT: {'type': 'int', 'count': 1, 'value': [0]},
-    BlockserverPVNames.BLOCK_DETAILS: char_waveform(16000),
-    BlockserverPVNames.GROUPS: char_waveform(16000),
-    BlockserverPVNames.COMPS: char_waveform(16000),
-    BlockserverPVNames.LOAD_CONFIG: char_waveform(1000),
-    BlockserverPVNames.RELOAD_CURRENT_CONFIG: char_waveform(100),
-    BlockserverPVNames.START_IOCS: char_waveform(16000),
-    BlockserverPVNames.STOP_IOCS: char_waveform(1000),
-    BlockserverPVNames.RESTART_IOCS: char_waveform(1000),
-    BlockserverPVNames.CONFIGS: char_waveform(16000),
-    BlockserverPVNames.GET_CURR_CONFIG_DETAILS: char_waveform(64000),
-    BlockserverPVNames.SET_CURR_CONFIG_DETAILS: char_waveform(64000),
-    BlockserverPVNames.SAVE_NEW_CONFIG: char_waveform(64000),
-    BlockserverPVNames.SAVE_NEW_COMPONENT: char_waveform(64000),
-    BlockserverPVNames.SERVER_STATUS: char_waveform(1000),
-    BlockserverPVNames.DELETE_CONFIGS: char_waveform(64000),
-    BlockserverPVNames.DELETE_COMPONENTS: char_waveform(64000),
-    BlockserverPVNames.BLANK_CONFIG: char_waveform(64000),
-    BlockserverPVNames.ALL_COMPONENT_DETAILS: char_waveform(64000),
-    BlockserverPVNames.BANNER_DESCRIPTION: char_waveform(16000),
-    BlockserverPVNames.CURR_CONFIG_NAME: char_waveform(500),
-    BlockserverPVNames.CURR_CONFIG_NAME_SEVR: {'type': 'enum', 'count': 1, 'value': CURR_CONFIG_NAME_SEVR_VALUE, "enums": ["NO_ALARM"]}
+# Char waveform PVs grouped by the number of characters they can hold
+_CHAR_WAVEFORM_PVS_BY_SIZE = {
+    100: [BlockserverPVNames.RELOAD_CURRENT_CONFIG],
+    500: [BlockserverPVNames.CURR_CONFIG_NAME],
+    1000: [BlockserverPVNames.LOAD_CONFIG, BlockserverPVNames.STOP_IOCS, BlockserverPVNames.RESTART_IOCS,
+           BlockserverPVNames.SERVER_STATUS],
+    16000: [BlockserverPVNames.BLOCKNAMES, BlockserverPVNames.BLOCK_DETAILS, BlockserverPVNames.GROUPS,
+            BlockserverPVNames.COMPS, BlockserverPVNames.START_IOCS, BlockserverPVNames.CONFIGS,
+            BlockserverPVNames.BANNER_DESCRIPTION],
+    64000: [BlockserverPVNames.GET_CURR_CONFIG_DETAILS, BlockserverPVNames.SET_CURR_CONFIG_DETAILS,
+            BlockserverPVNames.SAVE_NEW_CONFIG, BlockserverPVNames.SAVE_NEW_COMPONENT,
+            BlockserverPVNames.DELETE_CONFIGS, BlockserverPVNames.DELETE_COMPONENTS, BlockserverPVNames.BLANK_CONFIG,
+            BlockserverPVNames.ALL_COMPONENT_DETAILS],
 }
 
+# For documentation on these commands see the wiki
+initial_dbs = {pv: char_waveform(size) for size, pvs in _CHAR_WAVEFORM_PVS_BY_SIZE.items() for pv in pvs}
+initial_dbs[BlockserverPVNames.HEARTBEAT] = {'type': 'int', 'count': 1, 'value': [0]}
+initial_dbs[BlockserverPVNames.CURR_CONFIG_NAME_SEVR] = {'type': 'enum', 'count': 1, 'value': CURR_CONFIG_NAME_SEVR_VALUE,
+                                                         "enums": ["NO_ALARM"]}
+
+
+def batched_monitor_updates(func):
+    """
+    Decorator which defers posting monitor updates to clients until the decorated BlockServer method has finished.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self.batch_monitor_updates():
+            return func(self, *args, **kwargs)
+    return wrapper
+
+
+@lru_cache(maxsize=None)
+def server_status_value(status):
+    """Gets the compressed JSON for a server status. The statuses are the fixed write queue states, so are all cached.
+
+    Args:
+        status (string): The status
+
+    Returns:
+        bytes : The compressed and hexed JSON for the status
+    """
+    return compress_and_hex_json({'status': status})
+
 
 class BlockServer(Driver):
     """The class for handling all the static PV access and monitors etc.
@@ -108,8 +131,10 @@ class BlockServer(Driver):
         super(BlockServer, self).__init__()
 
         # Threading stuff
+        # Re-entrant as monitor updates batched by a thread already holding the lock are posted under it on exit
         self.monitor_lock = RLock()
         self.write_queue = Queue()
+        self._monitor_batch = local()
 
         FILEPATH_MANAGER.initialise(CONFIG_DIR, SCRIPT_DIR, SCHEMA_DIR)
         drive = os.path.abspath('.').split(os.path.sep)[0]+os.path.sep
@@ -129,6 +154,13 @@ class BlockServer(Driver):
         self.group_rules = GroupRules(self)
         self.config_desc = ConfigurationDescriptionRules(self)
         self.spangle_banner = json.dumps(ConfigurationFileManager.get_banner_config())
+        # A blank configuration never changes, so only create it once
+        self._blank_config_json = convert_to_json(self.get_blank_config())
+
+        # The uncompressed values last published on the monitor PVs, so unchanged values are not recompressed
+        self._monitor_values = dict()
+        # The last uncompressed and compressed values returned by read for each PV, to avoid recompressing on reads
+        self._read_values = dict()
 
         # Connect to version control
         try:
@@ -170,6 +202,44 @@ class BlockServer(Driver):
                 "in version control: %s " % str(err), "MINOR")
             self._config_list = ConfigListManager(self, ConfigurationFileManager())
 
+        # Lookup of read PVs to functions that get the value to return
+        self._read_handlers = {
+            BlockserverPVNames.BLANK_CONFIG:
+                lambda: self._compress_for_read(BlockserverPVNames.BLANK_CONFIG, self._blank_config_json),
+            BlockserverPVNames.BANNER_DESCRIPTION:
+                lambda: self._compress_for_read(BlockserverPVNames.BANNER_DESCRIPTION, self.spangle_banner),
+            BlockserverPVNames.CURR_CONFIG_NAME:
+                lambda: self._active_configserver.get_config_name(),
+            BlockserverPVNames.CURR_CONFIG_NAME_SEVR:
+                lambda: CURR_CONFIG_NAME_SEVR_VALUE,
+            BlockserverPVNames.HEARTBEAT:
+                lambda: 0,
+        }
+
+        # Lookup of write PVs to functions that create the write queue entry for the written data
+        self._write_commands = {
+            BlockserverPVNames.LOAD_CONFIG:
+                lambda data: (self.load_config, (data,), "LOADING_CONFIG"),
+            BlockserverPVNames.RELOAD_CURRENT_CONFIG:
+                lambda data: (self.reload_current_config, (), "RELOAD_CURRENT_CONFIG"),
+            BlockserverPVNames.START_IOCS:
+                lambda data: (self.start_iocs, (convert_from_json(data),), "START_IOCS"),
+            BlockserverPVNames.STOP_IOCS:
+                lambda data: (self._ioc_control.stop_iocs, (convert_from_json(data),), "STOP_IOCS"),
+            BlockserverPVNames.RESTART_IOCS:
+                lambda data: (self._ioc_control.restart_iocs, (convert_from_json(data), True), "RESTART_IOCS"),
+            BlockserverPVNames.SET_CURR_CONFIG_DETAILS:
+                lambda data: (self._set_curr_config, (data,), "SETTING_CONFIG"),
+            BlockserverPVNames.SAVE_NEW_CONFIG:
+                lambda data: (self.save_config, (data,), "SAVING_NEW_CONFIG"),
+            BlockserverPVNames.SAVE_NEW_COMPONENT:
+                lambda data: (self.save_config, (data, True), "SAVING_NEW_COMP"),
+            BlockserverPVNames.DELETE_CONFIGS:
+                lambda data: (self._config_list.delete_configs, (convert_from_json(data),), "DELETE_CONFIGS"),
+            BlockserverPVNames.DELETE_COMPONENTS:
+                lambda data: (self._config_list.delete_components, (convert_from_json(data),), "DELETE_COMPONENTS"),
+        }
+
         # Start a background thread for handling write commands
         write_thread = Thread(target=self.consume_write_queue, args=())
         write_thread.daemon = True  # Daemonise thread
@@ -184,6 +254,7 @@ class BlockServer(Driver):
         self._component_switcher = ComponentSwitcher(self._config_list, self.write_queue, self.reload_current_config)
         self._component_switcher.create_monitors()
 
+    @batched_monitor_updates
     def initialise_configserver(self, facility):
         """Initialises the ActiveConfigHolder.
 
@@ -237,26 +308,11 @@ class BlockServer(Driver):
             If an Exception is thrown in the reading of the information this is returned in compressed and hexed JSON.
         """
         try:
-            if reason == BlockserverPVNames.GROUPS:
-                grps = ConfigurationJsonConverter.groups_to_json(self._active_configserver.get_group_details())
-                value = compress_and_hex(grps)
-            elif reason == BlockserverPVNames.CONFIGS:
-                value = compress_and_hex(convert_to_json(self._config_list.get_configs()))
-            elif reason == BlockserverPVNames.COMPS:
-                value = compress_and_hex(convert_to_json(self._config_list.get_components()))
-            elif reason == BlockserverPVNames.BLANK_CONFIG:
-                js = convert_to_json(self.get_blank_config())
-                value = compress_and_hex(js)
-            elif reason == BlockserverPVNames.BANNER_DESCRIPTION:
-                value = compress_and_hex(self.spangle_banner)
-            elif reason == BlockserverPVNames.ALL_COMPONENT_DETAILS:
-                value = compress_and_hex(convert_to_json(list(self._config_list.all_components.values())))
-            elif reason == BlockserverPVNames.CURR_CONFIG_NAME:
-                value = self._active_configserver.get_config_name()
-            elif reason == BlockserverPVNames.CURR_CONFIG_NAME_SEVR:
-                value = CURR_CONFIG_NAME_SEVR_VALUE
-            elif reason == BlockserverPVNames.HEARTBEAT:
-                value = 0
+            # The groups, configs and components PVs are not handled here. Their monitors are kept up to date by the
+            # write queue thread, so the stored values are returned without compressing on the CA thread.
+            read_handler = self._read_handlers.get(reason)
+            if read_handler is not None:
+                value = read_handler()
             else:
                 # Check to see if it is a on-the-fly PV
                 for handler in self.on_the_fly_handlers:
@@ -265,10 +321,41 @@ class BlockServer(Driver):
 
                 value = self.getParam(reason)
         except Exception as err:
-            value = compress_and_hex(convert_to_json("Error: " + str(err)))
+            value = compress_and_hex_json("Error: " + str(err))
             print_and_log(str(err), "MAJOR")
         return value
 
+    def _compress_for_read(self, reason, value):
+        """Compresses and hexes a value to return from a read, reusing the previous result if the value is unchanged.
+
+        Args:
+            reason (string): The PV that is being read (without the PV prefix)
+            value (string): The uncompressed value
+
+        Returns:
+            bytes : The compressed and hexed value
+        """
+        previous_value, compressed = self._read_values.get(reason, (None, None))
+        if previous_value != value:
+            compressed = compress_and_hex(value)
+            self._check_pv_capacity(reason, len(compressed))
+            self._read_values[reason] = (value, compressed)
+        return compressed
+
+    @staticmethod
+    def _check_pv_capacity(pv, size):
+        """Checks the capacity of a PV and writes to the log if it is too small, because clients would only see a
+        truncated value.
+
+        Args:
+            pv (string): The PV to check (without the PV prefix)
+            size (int): The required size
+        """
+        count = initial_dbs[pv]['count']
+        if size > count:
+            print_and_log(f"Too much data to encode PV {pv}. Current size is {count} characters but {size} are "
+                          f"required", "MAJOR")
+
     def write(self, reason, value):
         """A method called by SimpleServer when a PV is written to the BlockServer over Channel Access. The write
             commands are queued as Channel Access is single-threaded.
@@ -284,26 +371,9 @@ class BlockServer(Driver):
         status = True
         try:
             data = dehex_and_decompress(bytes(value, encoding="utf-8")).strip(b'"').decode("utf-8")
-            if reason == BlockserverPVNames.LOAD_CONFIG:
-                self.write_queue.put((self.load_config, (data,), "LOADING_CONFIG"))
-            elif reason == BlockserverPVNames.RELOAD_CURRENT_CONFIG:
-                self.write_queue.put((self.reload_current_config, (), "RELOAD_CURRENT_CONFIG"))
-            elif reason == BlockserverPVNames.START_IOCS:
-                self.write_queue.put((self.start_iocs, (convert_from_json(data),), "START_IOCS"))
-            elif reason == BlockserverPVNames.STOP_IOCS:
-                self.write_queue.put((self._ioc_control.stop_iocs, (convert_from_json(data),), "STOP_IOCS"))
-            elif reason == BlockserverPVNames.RESTART_IOCS:
-                self.write_queue.put((self._ioc_control.restart_iocs, (convert_from_json(data), True), "RESTART_IOCS"))
-            elif reason == BlockserverPVNames.SET_CURR_CONFIG_DETAILS:
-                self.write_queue.put((self._set_curr_config, (data,), "SETTING_CONFIG"))
-            elif reason == BlockserverPVNames.SAVE_NEW_CONFIG:
-                self.write_queue.put((self.save_config, (data,), "SAVING_NEW_CONFIG"))
-            elif reason == BlockserverPVNames.SAVE_NEW_COMPONENT:
-                self.write_queue.put((self.save_config, (data, True), "SAVING_NEW_COMP"))
-            elif reason == BlockserverPVNames.DELETE_CONFIGS:
-                self.write_queue.put((self._config_list.delete_configs, (convert_from_json(data),), "DELETE_CONFIGS"))
-            elif reason == BlockserverPVNames.DELETE_COMPONENTS:
-                self.write_queue.put((self._config_list.delete_components, (convert_from_json(data),), "DELETE_COMPONENTS"))
+            command = self._write_commands.get(reason)
+            if command is not None:
+                self.write_queue.put(command(data))
             else:
                 status = False
                 # Check to see if it is a on-the-fly PV
@@ -314,11 +384,11 @@ class BlockServer(Driver):
                         break
 
         except Exception as err:
-            value = compress_and_hex(convert_to_json("Error: " + str(err)))
+            value = compress_and_hex_json("Error: " + str(err))
             print_and_log(str(err), "MAJOR")
         else:
             if status:
-                value = compress_and_hex(convert_to_json("OK"))
+                value = OK_RESPONSE
 
         # store the values
         if status:
@@ -338,6 +408,7 @@ class BlockServer(Driver):
             print_and_log("Loaded last configuration: %s" % last)
         self._initialise_config()
 
+    @batched_monitor_updates
     def _set_curr_config(self, details):
         """Sets the current configuration details to that defined in the JSON, saves to disk,
         then re-initialises the current configuration.
@@ -347,7 +418,8 @@ class BlockServer(Driver):
         """
 
         current_name = self._active_configserver.get_config_name()
-        details_name = convert_from_json(details)["name"]
+        new_details = convert_from_json(details)
+        details_name = new_details["name"]
 
         # This method saves the given details and then reloads the current config.
         # Sending the details of a new config to this method, as was being done incorrectly (see #4606)
@@ -356,8 +428,9 @@ class BlockServer(Driver):
             print_and_log(f"Config details to be set ({details_name}) did not match current config ({current_name})",
                           "MINOR")
 
-        self.save_config(details)
+        self._save_config_details(new_details)
 
+    @batched_monitor_updates
     def _initialise_config(self, full_init=False):
         """Responsible for initialising the configuration.
         Sets all the monitors, initialises the gateway, etc.
@@ -471,8 +544,15 @@ class BlockServer(Driver):
             json_data (string): The JSON data containing the configuration/component
             as_comp (bool): Whether it is a component or not
         """
-        new_details = convert_from_json(json_data)
+        self._save_config_details(convert_from_json(json_data), as_comp)
+
+    def _save_config_details(self, new_details, as_comp=False):
+        """Save a configuration from details which have already been converted from JSON.
 
+        Args:
+            new_details (dict): The details of the configuration/component
+            as_comp (bool): Whether it is a component or not
+        """
         config_name = new_details["name"]
 
         new_config_is_protected = new_details.get("isProtected", False)
@@ -539,17 +619,61 @@ class BlockServer(Driver):
     def _get_timestamp(self):
         return datetime.datetime.strftime(datetime.datetime.now(), '%Y-%m-%d %H:%M:%S')
 
+    def updatePVs(self):
+        """Posts updates for all changed PVs to clients. If this thread is in a batch of monitor updates the post is
+        deferred until the batch finishes.
+        """
+        if getattr(self._monitor_batch, "depth", 0) > 0:
+            self._monitor_batch.pending = True
+        else:
+            super(BlockServer, self).updatePVs()
+
+    @contextmanager
+    def batch_monitor_updates(self):
+        """Context manager which defers posting monitor updates made on this thread until the outermost batch exits,
+        so that a logical operation results in a single update to clients.
+        """
+        batch = self._monitor_batch
+        batch.depth = getattr(batch, "depth", 0) + 1
+        try:
+            yield
+        finally:
+            batch.depth -= 1
+            if batch.depth == 0 and getattr(batch, "pending", False):
+                batch.pending = False
+                with self.monitor_lock:
+                    self.updatePVs()
+
+    def _set_monitor_param(self, pv, value):
+        """Compresses and sets the value of a monitor PV, unless it is unchanged since it was last set.
+
+        Args:
+            pv (string): The PV to set (without the PV prefix)
+            value (string): The uncompressed value for the PV
+
+        Returns:
+            bool : True if the PV was set; False if the value was unchanged
+        """
+        if self._monitor_values.get(pv) == value:
+            return False
+        compressed = compress_and_hex(value)
+        self._check_pv_capacity(pv, len(compressed))
+        self.setParam(pv, compressed)
+        self._monitor_values[pv] = value
+        return True
+
     def update_blocks_monitors(self):
         """Updates the PV monitors for the blocks and groups, so the clients can see any changes.
         """
         with self.monitor_lock:
             block_names = convert_to_json(self._active_configserver.get_blocknames())
-            self.setParam(BlockserverPVNames.BLOCKNAMES, compress_and_hex(block_names))
+            changed = self._set_monitor_param(BlockserverPVNames.BLOCKNAMES, block_names)
 
             groups = ConfigurationJsonConverter.groups_to_json(self._active_configserver.get_group_details())
-            self.setParam(BlockserverPVNames.GROUPS, compress_and_hex(groups))
+            changed |= self._set_monitor_param(BlockserverPVNames.GROUPS, groups)
 
-            self.updatePVs()
+            if changed:
+                self.updatePVs()
 
     def update_server_status(self, status=""):
         """Updates the monitor for the server status, so the clients can see any changes.
@@ -559,7 +683,7 @@ class BlockServer(Driver):
         """
         if self._active_configserver is not None:
             with self.monitor_lock:
-                self.setParam(BlockserverPVNames.SERVER_STATUS, compress_and_hex(convert_to_json({'status': status})))
+                self.setParam(BlockserverPVNames.SERVER_STATUS, server_status_value(status))
                 self.updatePVs()
 
     def update_get_details_monitors(self):
@@ -567,8 +691,8 @@ class BlockServer(Driver):
         """
         with self.monitor_lock:
             config_details_json = convert_to_json(self._active_configserver.get_config_details())
-            self.setParam(BlockserverPVNames.GET_CURR_CONFIG_DETAILS, compress_and_hex(config_details_json))
-            self.updatePVs()
+            if self._set_monitor_param(BlockserverPVNames.GET_CURR_CONFIG_DETAILS, config_details_json):
+                self.updatePVs()
 
     def update_curr_config_name_monitors(self):
         """Updates the monitor for the active configuration name, so the clients can see any changes.
@@ -599,6 +723,8 @@ class BlockServer(Driver):
                     f"Error executing write queue command {cmd.__name__} for state {state}: {err}",
                     "MAJOR")
                 traceback.print_exc()
+            # Commands may have changed the config files, so have them committed and pushed now
+            self._config_vc.request_push()
             self.update_server_status("")
 
     def get_blank_config(self):
@@ -19,7 +19,7 @@ from __future__ import print_function, absolute_import, division, unicode_litera
 Module for reading data from the ioc database.
 """
 
-from threading import RLock
+from threading import Lock
 from server_common.utilities import print_and_log
 
 
@@ -40,7 +40,7 @@ class IOCData(object):
         self._procserve = procserver
         self._prefix = prefix
         self._running_iocs = list()
-        self._running_iocs_lock = RLock()
+        self._running_iocs_lock = Lock()
 
     def get_iocs(self):
         """
@@ -50,11 +50,11 @@ class IOCData(object):
             dict : IOCs and their running status
         """
         iocs = self._ioc_data_source.get_iocs_and_descriptions()
+        with self._running_iocs_lock:
+            # Create a copy so we don't lock the list for longer than necessary
+            running = set(self._running_iocs)
         for ioc in iocs.keys():
             ioc = str(ioc)
-            with self._running_iocs_lock:
-                # Create a copy so we don't lock the list for longer than necessary (do we need to do this?)
-                running = list(self._running_iocs)
             iocs[ioc]["running"] = ioc in running
         return iocs
 
@@ -106,12 +106,17 @@ class IocDataSource(object):
         """
         # Get as a plain list of lists
         values = [list(element) for element in self.mysql_abstraction_layer.query(sqlquery, bind_vars)]
-
-        # Convert any bytearrays
-        for i, pv in enumerate(values):
-            for j, element in enumerate(pv):
+        if not values:
+            return values
+
+        # Convert any bytearrays. A column holds the same type in every row (or None for NULL), so only the columns
+        # which are a bytearray or None in the first row need to be checked
+        columns_to_check = [j for j, element in enumerate(values[0]) if element is None or type(element) == bytearray]
+        for pv in values:
+            for j in columns_to_check:
+                element = pv[j]
                 if type(element) == bytearray:
-                    values[i][j] = element.decode("utf-8")
+                    pv[j] = element.decode("utf-8")
         return values
 
     def get_iocs_and_descriptions(self):
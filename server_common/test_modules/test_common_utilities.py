@@ -1,5 +1,19 @@
+import json
 import unittest
-from server_common.utilities import create_pv_name, remove_from_end, lowercase_and_make_unique
+
+from mock import patch
+
+from server_common import utilities
+from server_common.utilities import create_pv_name, remove_from_end, lowercase_and_make_unique, convert_to_json, \
+    convert_from_json
+
+JSON_VALUES = [
+    {"name": "test", "blocks": ["BLOCK_1", "BLOCK_2"], "component": None, "visible": True},
+    ["caf\u00e9", "\u00b5A", 1.5, -3],
+    float("inf"),
+    2 ** 70,
+    "",
+]
 
 
 class TestCreatePVName(unittest.TestCase):
@@ -171,3 +185,38 @@ class TestMakeUniqueAndLowercase(unittest.TestCase):
         result = lowercase_and_make_unique(["a", "A"])
         self.assertEqual(1, len(result))
         self.assertIn("a", result)
+
+
+class TestJsonConversion(unittest.TestCase):
+
+    def _convert_with_and_without_orjson(self, conversion, value):
+        with patch("server_common.utilities.orjson", None):
+            standard_library_result = conversion(value)
+        return conversion(value), standard_library_result
+
+    def test_WHEN_converted_to_json_THEN_output_is_same_as_json_dumps_whether_or_not_orjson_installed(self):
+        for value in JSON_VALUES + [float("nan")]:
+            result, standard_library_result = self._convert_with_and_without_orjson(convert_to_json, value)
+
+            self.assertEqual(result, json.dumps(value))
+            self.assertEqual(result, standard_library_result)
+
+    def test_WHEN_converted_from_json_THEN_object_is_same_whether_or_not_orjson_installed(self):
+        for value in JSON_VALUES:
+            result, standard_library_result = self._convert_with_and_without_orjson(
+                convert_from_json, json.dumps(value))
+
+            self.assertEqual(result, value)
+            self.assertEqual(result, standard_library_result)
+
+    def test_GIVEN_nan_WHEN_converted_to_and_from_json_THEN_nan_returned_whether_or_not_orjson_installed(self):
+        result, standard_library_result = self._convert_with_and_without_orjson(
+            convert_from_json, convert_to_json(float("nan")))
+
+        self.assertNotEqual(result, result)
+        self.assertNotEqual(standard_library_result, standard_library_result)
+
+    @unittest.skipIf(utilities.orjson is None, "orjson is not installed")
+    def test_GIVEN_invalid_json_WHEN_converted_from_json_THEN_json_decode_error_raised(self):
+        with self.assertRaises(json.JSONDecodeError):
+            convert_from_json("{not json")
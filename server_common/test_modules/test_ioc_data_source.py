@@ -79,6 +79,23 @@ class TestIocDataSource(unittest.TestCase):
 
         assert_that(result, is_(expected_result))
 
+    def test_GIVEN_bytearray_values_including_null_in_first_row_WHEN_get_values_THEN_values_decoded_to_strings(self):
+        query_return = {
+            "ioc1": [[bytearray(b"pv1"), bytearray(b"log_header1"), None],
+                     [bytearray(b"pv2"), bytearray(b"log_header2"), bytearray(b"an interesting value")]]
+        }
+        expected_result = {
+            "ioc1": [["pv1", "log_header1", None],
+                     ["pv2", "log_header2", "an interesting value"]]
+        }
+
+        mysql_abstraction_layer = SQLAbstractionStubForIOC(query_return)
+        data_source = IocDataSource(mysql_abstraction_layer)
+
+        result = data_source.get_pv_logging_info()
+
+        assert_that(result, is_(expected_result))
+
     def test_GIVEN_database_error_WHEN_get_values_THEN_error(self):
         mysql_abstraction_layer = SQLAbstractionStubForIOC({})
         mysql_abstraction_layer.query = Mock(side_effect=DatabaseError("DB Error"))
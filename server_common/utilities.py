@@ -28,11 +28,19 @@ from xml.etree import ElementTree
 from server_common.loggers.logger import Logger
 from server_common.common_exceptions import MaxAttemptsExceededException
 
+try:
+    import orjson
+except ImportError:
+    # orjson is a faster drop-in for parsing JSON, fall back to the standard library if it is not installed
+    orjson = None
 
 # Default to base class - does not actually log anything
 LOGGER = Logger()
 _LOGGER_LOCK = threading.RLock()  # To prevent message interleaving between different threads.
 
+COMPRESSION_LEVEL = 3
+"""zlib level used by compress_and_hex, faster than the default of 6 while keeping payloads within the PV sizes"""
+
 
 class SEVERITY(object):
     """
@@ -92,7 +100,7 @@ def compress_and_hex(value):
     assert type(value) == str, \
         "Non-str argument passed to compress_and_hex, maybe Python 2/3 compatibility issue\n" \
         "Argument was type {} with value {}".format(value.__class__.__name__, value)
-    compr = zlib.compress(bytes(value, "utf-8"))
+    compr = zlib.compress(bytes(value, "utf-8"), COMPRESSION_LEVEL)
     return binascii.hexlify(compr)
 
 
@@ -150,9 +158,27 @@ def convert_from_json(value):
     Returns:
         obj : An object corresponding to the given string
     """
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (e.g. NaN, integers over 64 bits), so let json decide or raise the error
+            pass
     return json.loads(value)
 
 
+def compress_and_hex_json(value):
+    """Converts the inputted object to JSON format then compresses it and encodes it as hex.
+
+    Args:
+        value (obj): The object to be converted
+
+    Returns:
+        bytes : A compressed and hexed version of the JSON representation of the inputted object
+    """
+    return compress_and_hex(convert_to_json(value))
+
+
 def parse_boolean(string):
     """Parses an xml true/false value to boolean
 